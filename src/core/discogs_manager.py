@@ -1,9 +1,13 @@
 import os
+import logging
 import discogs_client
 import requests
 import re
 from PySide6.QtCore import QObject, Signal, QThread
 
+# Per-search trace output; silent unless DEBUG logging is enabled
+log = logging.getLogger(__name__)
+
 class DiscogsSearchWorker(QThread):
     """Worker thread for Discogs search to avoid blocking the UI"""
     finished = Signal(list)  # List of search results
@@ -28,14 +32,14 @@ class DiscogsSearchWorker(QThread):
             
             # 0. Priority: Catalog Number
             if self.catalog_number:
-                print(f"Discogs Search (Structured): Catalog Number='{self.catalog_number}'")
+                log.debug("Discogs Search (Structured): Catalog Number='%s'", self.catalog_number)
                 params['catno'] = self.catalog_number
             
             # 1. If we have Album, prioritize finding that release
             elif self.album:
                 # Searching by release_title + artist is very specific
                 # We can try structured search
-                print(f"Discogs Search (Structured): Artist='{self.artist}', Release='{self.album}'")
+                log.debug("Discogs Search (Structured): Artist='%s', Release='%s'", self.artist, self.album)
                 params['artist'] = self.artist
                 params['release_title'] = self.album
                 
@@ -46,7 +50,7 @@ class DiscogsSearchWorker(QThread):
                 
             # 2. If no Album, but we have Artist + Title (likely a Track)
             elif self.artist and self.title:
-                print(f"Discogs Search (Structured): Artist='{self.artist}', Track='{self.title}'")
+                log.debug("Discogs Search (Structured): Artist='%s', Track='%s'", self.artist, self.title)
                 # Searching for releases that contain this track
                 params['artist'] = self.artist
                 params['track'] = self.title
@@ -55,7 +59,7 @@ class DiscogsSearchWorker(QThread):
             else:
                 raw_query = f"{self.artist} {self.album} {self.title}".strip()
                 query = DiscogsManager.clean_query(raw_query)
-                print(f"Discogs Search (Query): '{query}'")
+                log.debug("Discogs Search (Query): '%s'", query)
                 if not query:
                     self.error.emit("No search criteria provided")
                     return
@@ -72,12 +76,12 @@ class DiscogsSearchWorker(QThread):
             except: pass
             
             if count == 0 and (self.album or (self.artist and self.title) or self.catalog_number):
-                print("  - Structured search failed, falling back to simple query...")
+                log.debug("  - Structured search failed, falling back to simple query...")
                 raw_query = f"{self.artist} {self.album} {self.title} {self.catalog_number}".strip()
                 query = DiscogsManager.clean_query(raw_query)
                 results = self.client.search(query, type='release')
 
-            print(f"Discogs Search: Found {len(results)} potential matches")
+            log.debug("Discogs Search: Found %d potential matches", len(results))
             
             # Convert to list of dicts for easier handling
             matches = []
@@ -124,8 +128,7 @@ class DiscogsSearchWorker(QThread):
                         'format': r_format,
                         'is_cd': is_cd,
                     })
-                    format_tag = " [CD]" if is_cd else ""
-                    print(f"  - Match {i+1}: {r_artists} - {r_title} ({r_year}){format_tag}")
+                    log.debug("  - Match %d: %s - %s (%s)%s", i + 1, r_artists, r_title, r_year, " [CD]" if is_cd else "")
                 except Exception as e:
                     print(f"  - Error parsing search result {i+1}: {e}")
                     continue
@@ -303,7 +306,7 @@ class DiscogsManager(QObject):
             raw_query = f"{artist} {title}"
             query = self.clean_query(raw_query)
             
-            print(f"Discogs Auto-match: Searching for '{query}'")
+            log.debug("Discogs Auto-match: Searching for '%s'", query)
             
             if not query:
                 return None
@@ -331,10 +334,11 @@ class DiscogsManager(QObject):
             
             # Simple fuzzy matching (case-insensitive contains)
             if artist.lower() in result_artist.lower() and title.lower() in result_title.lower():
-                print(f"Discogs Auto-match: Confident match found! ID: {first_result.id} ({result_artist} - {result_title})")
+                log.debug("Discogs Auto-match: Confident match found! ID: %s (%s - %s)", first_result.id, result_artist, result_title)
                 return first_result.id
             
-            print(f"Discogs Auto-match: Ambiguous match. Top result: '{result_artist} - {result_title}' does not closely enough match '{artist} - {title}'")
+            log.debug("Discogs Auto-match: Ambiguous match. Top result: '%s - %s' does not closely enough match '%s - %s'",
+                      result_artist, result_title, artist, title)
             # If ambiguous, return None (user will manually select)
             return None
             
@@ -2,6 +2,18 @@ import os
 from PySide6.QtCore import QObject, Signal, QThread
 import yt_dlp
 
+# Numeric job fields also get a parsed int stored alongside the display value,
+# so sorting compares ints instead of re-parsing "1/10"-style strings
+NUMERIC_FIELDS = {'year': '_year_n', 'track': '_track_n', 'disc_number': '_disc_n'}
+
+def store_sort_numbers(job: dict):
+    for key, num_key in NUMERIC_FIELDS.items():
+        s = str(job.get(key, "")).split('/')[0]
+        try:
+            job[num_key] = int(s) if s else 0
+        except ValueError:
+            job[num_key] = 0
+
 class DownloadWorker(QThread):
     progress = Signal(float)
     download_finished = Signal(str) # Emitted when download + post-processing is done
@@ -191,6 +203,8 @@ class FetchInfoWorker(QThread):
                             'cover_path': cover_path, # Add cover path
                             'status': 'Pending'
                         })
+                        # Normalize here so the GUI thread only has to insert rows
+                        store_sort_numbers(results[-1])
             self.finished.emit(results)
         except Exception as e:
             self.error.emit(str(e))
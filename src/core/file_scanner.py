@@ -1,8 +1,16 @@
 import os
-from typing import List, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Callable, Iterator, Optional
+from PySide6.QtCore import QObject, QRunnable, Signal, QDir, QDirIterator
 from .metadata_manager import MetadataManager
 from .track import Track
 
+# Reading tags is mostly waiting on disk, so files are parsed on a few threads
+# rather than one after another. One pool for every scan keeps the total
+# bounded however many folders are dropped at once.
+_LOAD_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4),
+                                thread_name_prefix="tag-load")
+
 class FileScanner:
     def __init__(self):
         self.metadata_manager = MetadataManager()
@@ -15,27 +23,87 @@ class FileScanner:
         :return: List of Track objects.
         """
         tracks = []
-        if not os.path.exists(path):
-            return tracks
-
-        # Get supported extensions from MetadataManager
-        exts = self.metadata_manager.SUPPORTED_EXTENSIONS
-
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if file.lower().endswith(exts):
-                    full_path = os.path.join(root, file)
-                    try:
-                        # Load metadata immediately? 
-                        # For large libraries, we might want to do this lazily or in parallel.
-                        # For now, let's load it to populate the table.
-                        tags = self.metadata_manager.load_tags(full_path)
-                        track = Track(file_path=full_path, metadata=tags)
-                        tracks.append(track)
-                        
-                        if callback:
-                            callback(track)
-                    except Exception as e:
-                        print(f"Error scanning {full_path}: {e}")
-        
+        for chunk in self.iter_scan(path):
+            for track in chunk:
+                tracks.append(track)
+                if callback:
+                    callback(track)
         return tracks
+
+    def iter_scan(self, path: str, chunk_size: int = 64) -> Iterator[List[Track]]:
+        """
+        Like scan_directory, but yields lists of at most chunk_size tracks as they
+        are parsed so callers never hold the whole library at once.
+        """
+        for paths in self._iter_path_chunks(path, chunk_size):
+            # map keeps directory order within the chunk
+            chunk = [t for t in _LOAD_POOL.map(self._load_track, paths) if t is not None]
+            if chunk:
+                yield chunk
+
+    def _iter_path_chunks(self, path: str, chunk_size: int) -> Iterator[List[str]]:
+        if not os.path.exists(path):
+            return
+
+        # Let Qt do the walk and the extension filter in C++; name filters
+        # are case-insensitive. Hidden entries are included as os.walk did.
+        patterns = [f"*{e}" for e in self.metadata_manager.SUPPORTED_EXT_SET]
+        it = QDirIterator(path, patterns, QDir.Files | QDir.Hidden, QDirIterator.Subdirectories)
+        paths = []
+        while it.hasNext():
+            paths.append(QDir.toNativeSeparators(it.next()))
+            if len(paths) >= chunk_size:
+                yield paths
+                paths = []
+        if paths:
+            yield paths
+
+    def _load_track(self, full_path: str) -> Optional[Track]:
+        try:
+            tags = self.metadata_manager.load_tags(full_path)
+            return Track(file_path=full_path, metadata=tags)
+        except Exception as e:
+            print(f"Error scanning {full_path}: {e}")
+            return None
+
+class ScanSignals(QObject):
+    """Signals for ScanWorker; QRunnable itself can't own signals."""
+    batch_ready = Signal(list)  # List of Track objects
+    finished = Signal()
+
+    def __init__(self):
+        super().__init__()
+        # Set from the GUI thread when a newer scan replaces this one
+        self.canceled = False
+
+    def cancel(self):
+        self.canceled = True
+
+class ScanWorker(QRunnable):
+    """Scans one dropped/opened path on the thread pool, emitting tracks in batches."""
+    BATCH_SIZE = 64
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = ScanSignals()
+
+    def run(self):
+        # MetadataManager keeps no per-file state, so the scanner's load threads
+        # (shared with other scans) can all use it
+        scanner = FileScanner()
+        try:
+            if os.path.isdir(self.path):
+                for chunk in scanner.iter_scan(self.path, self.BATCH_SIZE):
+                    # Stop walking as soon as a newer scan takes over
+                    if self.signals.canceled:
+                        break
+                    self.signals.batch_ready.emit(chunk)
+            elif os.path.isfile(self.path) and not self.signals.canceled:
+                if os.path.splitext(self.path)[1].lower() in scanner.metadata_manager.SUPPORTED_EXT_SET:
+                    tags = scanner.metadata_manager.load_tags(self.path)
+                    self.signals.batch_ready.emit([Track(file_path=self.path, metadata=tags)])
+        except Exception as e:
+            print(f"Error scanning {self.path}: {e}")
+
+        self.signals.finished.emit()
@@ -1,5 +1,7 @@
 import os
+import re
 import shutil
+import functools
 from typing import Dict, Optional, Any, Union
 
 import mutagen
@@ -8,6 +10,14 @@ from mutagen.mp3 import MP3
 from mutagen.flac import FLAC, Picture
 from mutagen.mp4 import MP4, MP4Cover
 
+# Characters stripped by MetadataManager.sanitize_filename
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/*?:"<>|]')
+
+@functools.lru_cache(maxsize=4)
+def _read_image(path: str, mtime_ns: int, size: int) -> bytes:
+    with open(path, 'rb') as img:
+        return img.read()
+
 class MetadataManager:
     """
     Handles reading and writing metadata for MP3, FLAC, and M4A/AAC files.
@@ -30,16 +40,17 @@ class MetadataManager:
     KEY_CATALOG = 'catalog_number'
 
     SUPPORTED_EXTENSIONS = ('.mp3', '.flac', '.m4a', '.mp4')
+    # For splitext()[1].lower() lookups
+    SUPPORTED_EXT_SET = frozenset(SUPPORTED_EXTENSIONS)
 
     @staticmethod
     def sanitize_filename(name: str) -> str:
         """
         Replaces characters that are invalid in filenames.
         """
-        import re
         # keep alphanumeric and some common safe chars
         # remove / \ : * ? " < > |
-        safe = re.sub(r'[\\/*?:"<>|]', "", name)
+        safe = _UNSAFE_FILENAME_CHARS.sub("", name)
         return safe.strip()
 
     def load_tags(self, file_path: str) -> Dict[str, Any]:
@@ -92,6 +103,15 @@ class MetadataManager:
         
         return False
 
+    @staticmethod
+    def _read_cover(path: str) -> bytes:
+        """
+        Image bytes for cover art. A batch save embeds the same image in every
+        file, so it is read once per file version (path, mtime, size).
+        """
+        st = os.stat(path)
+        return _read_image(path, st.st_mtime_ns, st.st_size)
+
     def _extract_cover(self, data, ext='.jpg') -> Optional[str]:
         if not data: return None
         import tempfile
@@ -211,8 +231,7 @@ class MetadataManager:
                      del audio.tags[k]
 
         if cover_art_path and os.path.exists(cover_art_path):
-            with open(cover_art_path, 'rb') as img:
-                data = img.read()
+            data = self._read_cover(cover_art_path)
             mime = 'image/jpeg'
             if cover_art_path.lower().endswith('.png'):
                 mime = 'image/png'
@@ -277,8 +296,7 @@ class MetadataManager:
 
         if cover_art_path and os.path.exists(cover_art_path):
             p = Picture()
-            with open(cover_art_path, 'rb') as img:
-                p.data = img.read()
+            p.data = self._read_cover(cover_art_path)
             p.type = 3
             if cover_art_path.lower().endswith('.png'):
                 p.mime = 'image/png'
@@ -379,8 +397,7 @@ class MetadataManager:
                 pass
         
         if cover_art_path and os.path.exists(cover_art_path):
-             with open(cover_art_path, 'rb') as img:
-                data = img.read()
+             data = self._read_cover(cover_art_path)
              
              image_format = MP4Cover.FORMAT_JPEG
              if cover_art_path.lower().endswith('.png'):
@@ -392,37 +409,11 @@ class MetadataManager:
         return True
 
     @classmethod
-    def resolve_format(cls, format_str: str, tags: Dict[str, Any]) -> str:
+    @functools.lru_cache(maxsize=32)
+    def compile_format(cls, format_str: str) -> 'FormatPlan':
         """
-        Replaces %placeholder% with actual tag values.
+        Splits a format string once so it can be rendered/parsed for many files.
         """
-        mapping = {
-            '%artist%': tags.get(cls.KEY_ARTIST, ''),
-            '%title%': tags.get(cls.KEY_TITLE, ''),
-            '%album%': tags.get(cls.KEY_ALBUM, ''),
-            '%year%': tags.get(cls.KEY_YEAR, ''),
-            '%track%': tags.get(cls.KEY_TRACK, ''),
-            '%genre%': tags.get(cls.KEY_GENRE, ''),
-            '%comment%': tags.get(cls.KEY_COMMENT, ''),
-        }
-        
-        result = format_str
-        for placeholder, value in mapping.items():
-            result = result.replace(placeholder, str(value))
-        
-        return result
-
-    @classmethod
-    def parse_filename(cls, format_str: str, filename: str) -> Dict[str, Any]:
-        """
-        Extracts tags from a filename based on a format string.
-        """
-        import re
-        
-        # Remove extension
-        name_only = os.path.splitext(filename)[0]
-        
-        # Placeholders to internal keys mapping
         placeholders = {
             '%artist%': cls.KEY_ARTIST,
             '%title%': cls.KEY_TITLE,
@@ -433,7 +424,15 @@ class MetadataManager:
             '%comment%': cls.KEY_COMMENT,
         }
         
-        # Build regex pattern by escaping everything BUT the placeholders
+        # Rendering: literal text and tag keys in order (unknown %x% stays literal)
+        render_parts = []
+        for part in re.split('(' + '|'.join(map(re.escape, placeholders)) + ')', format_str):
+            if part in placeholders:
+                render_parts.append((placeholders[part], None))
+            elif part:
+                render_parts.append((None, part))
+        
+        # Parsing: build regex pattern by escaping everything BUT the placeholders
         # We'll split the format string by placeholders
         parts = re.split(r'(%[a-z]+%)', format_str)
         
@@ -452,20 +451,29 @@ class MetadataManager:
             else:
                 pattern += re.escape(part)
         
-        if not found_any:
-            return {}
-
-        pattern = f"^{pattern}$"
+        regex = None
+        if found_any:
+            try:
+                regex = re.compile(f"^{pattern}$")
+            except re.error as e:
+                # e.g. the same placeholder used twice
+                print(f"Regex error: {e}")
         
-        try:
-            match = re.match(pattern, name_only)
-            if match:
-                # Filter out empty or None matches
-                return {k: v for k, v in match.groupdict().items() if v is not None}
-        except Exception as e:
-            print(f"Regex error: {e}")
-            
-        return {}
+        return FormatPlan(tuple(render_parts), regex)
+
+    @classmethod
+    def resolve_format(cls, format_str: str, tags: Dict[str, Any]) -> str:
+        """
+        Replaces %placeholder% with actual tag values.
+        """
+        return cls.compile_format(format_str).render(tags)
+
+    @classmethod
+    def parse_filename(cls, format_str: str, filename: str) -> Dict[str, Any]:
+        """
+        Extracts tags from a filename based on a format string.
+        """
+        return cls.compile_format(format_str).parse(filename)
 
     @classmethod
     def guess_metadata_from_filename(cls, filename: str) -> Dict[str, Any]:
@@ -473,9 +481,17 @@ class MetadataManager:
         Attempts to guess metadata from filename using common patterns.
         Useful when file has no tags.
         """
-        import re
         name_only = os.path.splitext(os.path.basename(filename))[0]
-        
+        # Callers mutate the result, so hand out a fresh dict per call
+        return dict(cls._guess_from_name(name_only))
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _guess_from_name(cls, name_only: str) -> tuple:
+        """
+        Pattern matching behind guess_metadata_from_filename. Depends only on
+        the name, so re-matching the same files skips the regex work.
+        """
         guessed = {}
 
         # 1. Extract Catalog Number (e.g., [CAT001], [CAT-001])
@@ -521,4 +537,28 @@ class MetadataManager:
         if not matched_pattern:
             guessed[cls.KEY_TITLE] = name_only
         
-        return guessed
+        return tuple(guessed.items())
+
+
+class FormatPlan:
+    """
+    A compiled format string (see MetadataManager.compile_format).
+    """
+
+    def __init__(self, render_parts, regex):
+        self._render_parts = render_parts  # (tag key, None) or (None, literal text)
+        self._regex = regex  # None if the format has no usable placeholders
+
+    def render(self, tags: Dict[str, Any]) -> str:
+        return "".join(text if key is None else str(tags.get(key, ''))
+                       for key, text in self._render_parts)
+
+    def parse(self, filename: str) -> Dict[str, Any]:
+        if self._regex is None:
+            return {}
+        # Remove extension
+        match = self._regex.match(os.path.splitext(filename)[0])
+        if match:
+            # Filter out empty or None matches
+            return {k: v for k, v in match.groupdict().items() if v is not None}
+        return {}
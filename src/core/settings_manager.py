@@ -82,6 +82,30 @@ class SettingsManager:
     def column_metadata_downloads(self, value: list):
         self._settings.setValue("ui/downloads_column_state", value)
 
+    # Raw QHeaderView.saveState() blobs; restoring one is a single call instead of
+    # a moveSection per column. Cleared when the column dialog changes the layout.
+    @property
+    def header_state_library(self):
+        return self._settings.value("ui/library_header_state", None)
+
+    @header_state_library.setter
+    def header_state_library(self, value):
+        if value is None:
+            self._settings.remove("ui/library_header_state")
+        else:
+            self._settings.setValue("ui/library_header_state", value)
+
+    @property
+    def header_state_downloads(self):
+        return self._settings.value("ui/downloads_header_state", None)
+
+    @header_state_downloads.setter
+    def header_state_downloads(self, value):
+        if value is None:
+            self._settings.remove("ui/downloads_header_state")
+        else:
+            self._settings.setValue("ui/downloads_header_state", value)
+
     @property
     def visible_columns_library(self) -> list:
         return [c['name'] for c in self.column_metadata_library if c['visible']]
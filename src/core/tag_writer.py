@@ -0,0 +1,25 @@
+from typing import Dict, Any, Optional
+from PySide6.QtCore import QObject, QRunnable, Signal
+from .metadata_manager import MetadataManager
+
+class SaveSignals(QObject):
+    """Shared by every SaveJob of one save batch, so sender() identifies the batch."""
+    saved = Signal(str, object, bool)  # file_path, tags written, success
+
+class SaveJob(QRunnable):
+    """Writes tags for a single file on a thread pool."""
+
+    def __init__(self, signals: SaveSignals, path: str, tags: Dict[str, Any], cover_path: Optional[str] = None):
+        super().__init__()
+        self.signals = signals
+        self.path = path
+        self.tags = tags
+        self.cover_path = cover_path
+
+    def run(self):
+        try:
+            success = MetadataManager().save_tags(self.path, self.tags, self.cover_path)
+        except Exception as e:
+            print(f"Error saving tags for {self.path}: {e}")
+            success = False
+        self.signals.saved.emit(self.path, self.tags, success)
@@ -1,14 +1,29 @@
 import os
+import functools
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QCheckBox,
                                  QComboBox, QPushButton, QSpacerItem, QSizePolicy, QFrame, QMessageBox)
 from PySide6.QtCore import Qt, Signal
 
+from ..core.metadata_manager import MetadataManager
+
+@functools.lru_cache(maxsize=32)
+def _extract(fmt, fname):
+    """Cached parse_filename for the preview label; returns hashable items."""
+    extracted = MetadataManager.parse_filename(fmt, fname)
+    return tuple(extracted.items()) if extracted else ()
+
 class ConvertDialog(QDialog):
     def __init__(self, mode="tag_to_filename", initial_track_info=None, parent=None):
         super().__init__(parent)
         self.mode = mode # "tag_to_filename" or "filename_to_tag"
         self.track_info = initial_track_info or {}
         
+        # The source file is fixed for the dialog's lifetime, so parse its path once
+        orig = self.track_info.get('filepath', '')
+        self._cached_ext = os.path.splitext(orig)[1]
+        self._cached_fname = os.path.basename(self.track_info.get('filepath', 'Unknown.mp3'))
+        self._last_fmt = None
+        
         self.setWindowTitle("Tag - Filename" if mode == "tag_to_filename" else "Filename - Tag")
         self.setMinimumWidth(450)
         
@@ -46,6 +61,8 @@ class ConvertDialog(QDialog):
         
         # Preview
         self.preview_lbl = QLabel("Preview:")
+        # Preview text comes from tags/filenames; never treat it as rich text
+        self.preview_lbl.setTextFormat(Qt.PlainText)
         layout.addWidget(self.preview_lbl)
         
         layout.addSpacing(10)
@@ -69,6 +86,7 @@ class ConvertDialog(QDialog):
         
         # Connections
         self.fmt_combo.editTextChanged.connect(self._update_preview)
+        self._preview_connected = True
         self.btn_ok.clicked.connect(self.accept)
         self.btn_cancel.clicked.connect(self.reject)
         self.btn_help.clicked.connect(self._show_help)
@@ -78,27 +96,33 @@ class ConvertDialog(QDialog):
     def get_format(self):
         return self.fmt_combo.currentText()
 
+    def done(self, r):
+        # Stop preview recomputes once the dialog is closing; callers may keep
+        # the dialog alive afterwards to read get_format()
+        if self._preview_connected:
+            self.fmt_combo.editTextChanged.disconnect(self._update_preview)
+            self._preview_connected = False
+        super().done(r)
+
     def _update_preview(self):
-        from ..core.metadata_manager import MetadataManager
         fmt = self.fmt_combo.currentText()
+        # editTextChanged can re-fire with identical text (focus, programmatic sets)
+        if fmt == self._last_fmt:
+            return
+        self._last_fmt = fmt
         
         if self.mode == "tag_to_filename":
             preview = MetadataManager.resolve_format(fmt, self.track_info)
             # Add extension from original file if available
-            orig = self.track_info.get('filepath', '')
-            ext = os.path.splitext(orig)[1]
-            self.preview_lbl.setText(f"{preview}{ext}")
+            self.preview_lbl.setText(f"{preview}{self._cached_ext}")
         else:
             # Filename to Tag
-            fname = os.path.basename(self.track_info.get('filepath', 'Unknown.mp3'))
-            extracted = MetadataManager.parse_filename(fmt, fname)
+            extracted = _extract(fmt, self._cached_fname)
             if extracted:
-                lines = ["Extracted data:"]
-                for k, v in extracted.items():
-                    # Capitalize key for display (e.g. 'artist' -> 'Artist')
-                    display_key = k.capitalize()
-                    lines.append(f"{display_key}: {v}")
-                self.preview_lbl.setText("\n".join(lines))
+                # Capitalize key for display (e.g. 'artist' -> 'Artist')
+                self.preview_lbl.setText(
+                    "Extracted data:\n" + "\n".join(f"{k.capitalize()}: {v}" for k, v in extracted)
+                )
             else:
                 self.preview_lbl.setText("No match found for this format.")
 
@@ -1,12 +1,198 @@
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, 
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableView,
                                  QTableWidgetItem, QPushButton, QLabel, QHeaderView, QCheckBox, QSplitter, QStyledItemDelegate)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QBrush, QColor, QFont
+
+try:
+    from rapidfuzz import process, fuzz, utils
+except ImportError:
+    process = None  # Fall back to difflib scoring
+
+# Shared score colours handed out from the models' ForegroundRole
+_GOOD_BRUSH = QBrush(QColor(Qt.darkGreen))
+_BAD_BRUSH = QBrush(QColor(Qt.red))
 
 class ElideLeftDelegate(QStyledItemDelegate):
     def paint(self, painter, option, index):
         option.textElideMode = Qt.ElideLeft
         super().paint(painter, option, index)
 
+class DiscogsMatchModel(QAbstractTableModel):
+    """
+    Read-only model over the raw list of Discogs search result dicts.
+    Cells are produced on demand in data(), so no per-cell items are allocated.
+    """
+    COLUMNS = ["Artist", "Title", "Format", "Score", "Year", "Label"]
+
+    def __init__(self, matches: list, parent=None):
+        super().__init__(parent)
+        self._matches = matches
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._matches)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        match = self._matches[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return match.get('artists', '')
+            if col == 1:
+                return match.get('title', '')
+            if col == 2:
+                return match.get('format', '')
+            if col == 3:
+                score = match.get('_calculated_score', 0)
+                return "…" if score is None else f"{int(score)}%"
+            if col == 4:
+                # The API usually hands back an int year; skip str() when it's already text
+                year = match.get('year', '')
+                return year if isinstance(year, str) else f"{year}"
+            if col == 5:
+                return match.get('label', '')
+
+        if col == 3 and role in (Qt.ForegroundRole, Qt.FontRole):
+            score = match.get('_calculated_score', 0)
+            if score is None:
+                return None
+            if role == Qt.FontRole:
+                return self._bold_font if score > 80 else None
+            if score > 80:
+                return _GOOD_BRUSH
+            if score < 50:
+                return _BAD_BRUSH
+            return None
+
+        # Release ID is exposed on the first column
+        if role == Qt.UserRole and col == 0:
+            return match.get('id')
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def set_scores(self, scores: list, min_score: float = 0, min_rows: int = 0):
+        """
+        Store scores (aligned with the current row order) and re-sort.
+        Rows below min_score are dropped, unless that would leave fewer than min_rows.
+        """
+        self.beginResetModel()
+        for match, score in zip(self._matches, scores):
+            match['_calculated_score'] = score
+        if min_score:
+            kept = [m for m in self._matches if m['_calculated_score'] >= min_score]
+            if len(kept) >= min_rows:
+                # New list; the caller's list is left as it was
+                self._matches = kept
+        self._matches.sort(key=_match_sort_key, reverse=True)
+        self.endResetModel()
+
+    def row_for_id(self, release_id):
+        """Row of the match with this release ID, or None."""
+        return next((i for i, m in enumerate(self._matches) if m.get('id') == release_id), None)
+
+def _match_sort_key(match):
+    # is_cd (True first), then score; unscored rows sort as 0
+    return (match.get('is_cd', False), match.get('_calculated_score') or 0)
+
+# Matches scoring below this are hidden, as long as enough candidates remain
+SCORE_CUTOFF = 25
+MIN_VISIBLE_MATCHES = 5
+
+def score_matches(query_info: str, targets: list, score_cutoff: float = 0) -> list:
+    """
+    Fuzzy-match query_info against each target string, returning 0-100 scores.
+    With rapidfuzz, targets below score_cutoff bail out early and score 0.
+    """
+    if process is not None:
+        # Score all candidates in one batch call (already on a 0-100 scale)
+        scores = [0.0] * len(targets)
+        for _, score, idx in process.extract(query_info, targets, scorer=fuzz.ratio,
+                                             processor=utils.default_process, limit=None,
+                                             score_cutoff=score_cutoff):
+            scores[idx] = float(score)
+        return scores
+
+    from difflib import SequenceMatcher
+    
+    q_lower = query_info.lower()
+    # The query is seq2, whose lookup table SequenceMatcher caches, so one
+    # matcher can be reused across every target via set_seq1()
+    sm = SequenceMatcher(None, autojunk=False)
+    sm.set_seq2(q_lower)
+    scores = []
+    for target in targets:
+        target_l = target.lower()
+        if target_l == q_lower:
+            scores.append(100.0)
+            continue
+        sm.set_seq1(target_l)
+        # quick_ratio() is a cheap upper bound on ratio(); anything under
+        # 50% is already shown as a poor match, so skip the full compare
+        upper = sm.quick_ratio()
+        scores.append((upper if upper < 0.5 else sm.ratio()) * 100)
+    return scores
+
+def similarity_matrix(queries: list, targets: list) -> list:
+    """
+    Title similarity (0-1) of every query against every target, as
+    rows[query][target]. Used to map local files onto a release tracklist.
+    """
+    if process is not None:
+        rows = []
+        for query in queries:
+            row = [0.0] * len(targets)
+            for _, score, idx in process.extract(query, targets, scorer=fuzz.ratio,
+                                                 processor=utils.default_process, limit=None):
+                row[idx] = score / 100
+            rows.append(row)
+        return rows
+
+    from difflib import SequenceMatcher
+    
+    rows = [[0.0] * len(targets) for _ in queries]
+    queries_l = [q.lower() for q in queries]
+    # One matcher per target: seq2's lookup table is built once and reused
+    # for every query
+    sm = SequenceMatcher(None)
+    for j, target in enumerate(targets):
+        sm.set_seq2(target.lower())
+        for i, query_l in enumerate(queries_l):
+            sm.set_seq1(query_l)
+            rows[i][j] = sm.ratio()
+    return rows
+
+class _ScorerSignals(QObject):
+    scoresReady = Signal(list)
+
+class _MatchScorer(QRunnable):
+    """Runs score_matches() on the global thread pool."""
+    def __init__(self, query_info: str, targets: list):
+        super().__init__()
+        self.query_info = query_info
+        self.targets = targets
+        self.signals = _ScorerSignals()
+
+    def run(self):
+        scores = score_matches(self.query_info, self.targets, SCORE_CUTOFF)
+        if sum(score >= SCORE_CUTOFF for score in scores) < MIN_VISIBLE_MATCHES:
+            # Too few survive the cutoff, so every row stays visible; score them
+            # fully so the weak ones show their real similarity instead of 0%
+            scores = score_matches(self.query_info, self.targets)
+        self.signals.scoresReady.emit(scores)
+
 class DiscogsMatchDialog(QDialog):
     """Dialog for manually selecting a Discogs release when multiple matches are found"""
     
@@ -31,55 +217,26 @@ class DiscogsMatchDialog(QDialog):
             sub.setStyleSheet("color: #666; margin-bottom: 5px;")
             layout.addWidget(sub)
         
-        from difflib import SequenceMatcher
-        
-        # Pre-calculate scores and sort
+        # Scores are computed on the thread pool; rows show a placeholder until then
         for match in self.matches:
-            artist = match.get('artists', '')
-            title = match.get('title', '')
-            score = 0
-            if query_info:
-                target = f"{artist} - {title}"
-                score = SequenceMatcher(None, query_info.lower(), target.lower()).ratio() * 100
-            match['_calculated_score'] = score
+            match['_calculated_score'] = None if query_info else 0
 
         # Sort: is_cd (True first), then score (descending)
-        self.matches.sort(key=lambda m: (m.get('is_cd', False), m.get('_calculated_score', 0)), reverse=True)
+        self.matches.sort(key=_match_sort_key, reverse=True)
+
+        self._scorer = None
+        if query_info:
+            targets = [f"{m.get('artists', '')} - {m.get('title', '')}" for m in self.matches]
+            self._scorer = _MatchScorer(query_info, targets)
+            self._scorer.signals.scoresReady.connect(self._on_scores_ready)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["Artist", "Title", "Format", "Score", "Year", "Label"])
-        self.table.setRowCount(len(self.matches))
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        
-        # Populate table
-        for row, match in enumerate(self.matches):
-            artist = match.get('artists', '')
-            title = match.get('title', '')
-            score = match.get('_calculated_score', 0)
-            
-            self.table.setItem(row, 0, QTableWidgetItem(artist))
-            self.table.setItem(row, 1, QTableWidgetItem(title))
-            self.table.setItem(row, 2, QTableWidgetItem(match.get('format', '')))
-            
-            score_item = QTableWidgetItem(f"{int(score)}%")
-            if score > 80:
-                score_item.setForeground(Qt.darkGreen)
-                font = score_item.font()
-                font.setBold(True)
-                score_item.setFont(font)
-            elif score < 50:
-                score_item.setForeground(Qt.red)
-            
-            self.table.setItem(row, 3, score_item)
-            self.table.setItem(row, 4, QTableWidgetItem(str(match.get('year', ''))))
-            self.table.setItem(row, 5, QTableWidgetItem(match.get('label', '')))
-            
-            # Store release ID in row data
-            self.table.item(row, 0).setData(Qt.UserRole, match.get('id'))
+        self.table = QTableView()
+        self.model = DiscogsMatchModel(self.matches, self)
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
         
         # Auto-select first row (or best score?)
         if matches:
@@ -110,13 +267,32 @@ class DiscogsMatchDialog(QDialog):
         
         # Double-click to select
         self.table.doubleClicked.connect(self._on_select)
+        
+        if self._scorer is not None:
+            QThreadPool.globalInstance().start(self._scorer)
     
+    def _on_scores_ready(self, scores):
+        """Apply background scores, re-sort and keep the current pick selected."""
+        # Row 0 is the automatic pick; only a different row means the user chose it
+        selected = self.table.selectionModel().selectedRows()
+        keep_id = None
+        if selected and selected[0].row() != 0:
+            keep_id = self.model.data(self.model.index(selected[0].row(), 0), Qt.UserRole)
+        
+        self.model.set_scores(scores, SCORE_CUTOFF, MIN_VISIBLE_MATCHES)
+        
+        row = 0
+        if keep_id is not None:
+            row = self.model.row_for_id(keep_id) or 0
+        if self.model.rowCount():
+            self.table.selectRow(row)
+
     def _on_select(self):
         """User confirmed their selection"""
-        selected_rows = self.table.selectedIndexes()
+        selected_rows = self.table.selectionModel().selectedRows()
         if selected_rows:
             row = selected_rows[0].row()
-            self.selected_id = self.table.item(row, 0).data(Qt.UserRole)
+            self.selected_id = self.model.data(self.model.index(row, 0), Qt.UserRole)
             self.accept()
     
     def get_selected_id(self):
@@ -138,6 +314,9 @@ class MetadataPreviewDialog(QDialog):
         ('catalog_number', 'Catalog #'),
         ('compilation', 'Compilation'),
     ]
+
+    # Shared by every changed row instead of resolving Qt.darkGreen per item
+    _CHANGE_BRUSH = _GOOD_BRUSH
     
     def __init__(self, current_metadata: dict, new_metadata: dict, track_name: str = "", parent=None):
         super().__init__(parent)
@@ -168,8 +347,8 @@ class MetadataPreviewDialog(QDialog):
         # Populate table with fields that have changes
         rows_with_changes = []
         for key, label in self.FIELDS:
-            current_val = str(current_metadata.get(key, '') or '')
-            new_val = str(new_metadata.get(key, '') or '')
+            current_val = f"{current_metadata.get(key) or ''}"
+            new_val = f"{new_metadata.get(key) or ''}"
             
             # Always show Title and Artist for context, even if unchanged
             is_key_field = key in ['title', 'artist']
@@ -181,16 +360,17 @@ class MetadataPreviewDialog(QDialog):
         
         self.table.setRowCount(len(rows_with_changes))
         
+        change_font = QFont()
+        change_font.setBold(True)
+        
         for row, (label, current_val, new_val, has_change) in enumerate(rows_with_changes):
             self.table.setItem(row, 0, QTableWidgetItem(label))
             self.table.setItem(row, 1, QTableWidgetItem(current_val))
             
             new_item = QTableWidgetItem(new_val)
             if has_change:
-                new_item.setForeground(Qt.darkGreen)
-                font = new_item.font()
-                font.setBold(True)
-                new_item.setFont(font)
+                new_item.setForeground(self._CHANGE_BRUSH)
+                new_item.setFont(change_font)
             self.table.setItem(row, 2, new_item)
         
         # Resize columns
@@ -220,6 +400,102 @@ class MetadataPreviewDialog(QDialog):
     def was_approved(self):
         return self.approved
 
+class AlbumMappingModel(QAbstractTableModel):
+    """
+    Model over the local file -> Discogs track mapping.
+    Column 0 is a user-checkable "Apply" flag; everything else is read-only.
+    """
+    COLUMNS = ["Apply", "File", "L.#", "L.Title", "Discogs Track Match", "Score"]
+
+    def __init__(self, mapping: list, parent=None):
+        super().__init__(parent)
+        self._mapping = mapping
+        # Rows with a Discogs match start checked
+        self._checked_rows = {row for row, item in enumerate(mapping) if item['discogs_track']}
+        # The derived text columns never change, so build them once up front
+        self._d_titles = [self._discogs_title(item['discogs_track']) for item in mapping]
+        self._score_strs = [f"{int(item['score']*100)}%" for item in mapping]
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._mapping)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        col = index.column()
+        item = self._mapping[row]
+
+        if col == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row in self._checked_rows else Qt.Unchecked
+            return None
+
+        if role == Qt.DisplayRole:
+            if col == 1:
+                return item['file_name']
+            if col in (2, 3):
+                track_obj = item.get('track')
+                if not track_obj:
+                    return ''
+                return track_obj.metadata.get('track' if col == 2 else 'title', '')
+            if col == 4:
+                return self._d_titles[row]
+            if col == 5:
+                return self._score_strs[row]
+
+        if role == Qt.ToolTipRole and col == 1:
+            return item['file_name'] # Show full name on hover
+
+        if role == Qt.ForegroundRole:
+            if col == 4 and not item['discogs_track']:
+                return _BAD_BRUSH
+            if col == 5:
+                score = item['score']
+                if score < 0.6:
+                    return _BAD_BRUSH
+                if score > 0.9:
+                    return _GOOD_BRUSH
+
+        return None
+
+    @staticmethod
+    def _discogs_title(d_track):
+        if not d_track:
+            return "No Match"
+        pos = d_track.get('position', '')
+        title = d_track.get('title', '')
+        return f"{pos} - {title}" if pos else title
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked_rows.add(index.row())
+        else:
+            self._checked_rows.discard(index.row())
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def checked_items(self) -> list:
+        return [self._mapping[row] for row in sorted(self._checked_rows)]
+
 class AlbumMappingDialog(QDialog):
     """
     Dialog to review and adjust mapping between Local Files and Discogs Tracks.
@@ -242,56 +518,12 @@ class AlbumMappingDialog(QDialog):
         
         layout.addWidget(QLabel("Uncheck rows to skip incorrect matches."))
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["Apply", "File", "L.#", "L.Title", "Discogs Track Match", "Score"])
-        self.table.setRowCount(len(mapping))
+        self.table = QTableView()
+        self.model = AlbumMappingModel(mapping, self)
+        self.table.setModel(self.model)
         
         # Set Item Delegate for Filename column to elide left
         self.table.setItemDelegateForColumn(1, ElideLeftDelegate(self.table))
-        
-        for row, item in enumerate(mapping):
-            # Checkbox
-            chk = QTableWidgetItem()
-            chk.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            chk.setCheckState(Qt.Checked if item['discogs_track'] else Qt.Unchecked)
-            self.table.setItem(row, 0, chk)
-            
-            # Local File
-            local_name = item['file_name']
-            file_item = QTableWidgetItem(local_name)
-            file_item.setToolTip(local_name) # Show full name on hover
-            self.table.setItem(row, 1, file_item)
-            
-            # Local Track Metadata
-            track_obj = item.get('track')
-            l_num = track_obj.metadata.get('track', '') if track_obj else ''
-            l_title = track_obj.metadata.get('title', '') if track_obj else ''
-            
-            self.table.setItem(row, 2, QTableWidgetItem(l_num))
-            self.table.setItem(row, 3, QTableWidgetItem(l_title))
-            
-            # Discogs Track
-            d_track = item['discogs_track']
-            d_title = "No Match"
-            if d_track:
-                pos = d_track.get('position', '')
-                title = d_track.get('title', '')
-                d_title = f"{pos} - {title}" if pos else title
-            
-            d_item = QTableWidgetItem(d_title)
-            if not d_track:
-                d_item.setForeground(Qt.red)
-            self.table.setItem(row, 4, d_item)
-            
-            # Score
-            score = item['score']
-            s_item = QTableWidgetItem(f"{int(score*100)}%")
-            if score < 0.6:
-                s_item.setForeground(Qt.red)
-            elif score > 0.9:
-                s_item.setForeground(Qt.darkGreen)
-            self.table.setItem(row, 5, s_item)
             
         # Resize Modes
         header = self.table.horizontalHeader()
@@ -324,10 +556,7 @@ class AlbumMappingDialog(QDialog):
         layout.addLayout(btn_layout)
         
     def _on_apply(self):
-        self.approved_mapping = []
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0).checkState() == Qt.Checked:
-                self.approved_mapping.append(self.mapping[row])
+        self.approved_mapping = self.model.checked_items()
         self.accept()
     
     def get_mapping(self):
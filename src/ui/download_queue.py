@@ -1,20 +1,56 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, 
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QApplication,
                                  QPushButton, QTableView, QHeaderView, QAbstractItemView, QMessageBox, QMenu)
 from PySide6.QtGui import QAction
 import sys
 import os
 import subprocess
-from PySide6.QtCore import Qt, SLOT, QAbstractTableModel, QModelIndex, Signal
-
-from ..core.download_manager import DownloadManager
+from collections import defaultdict, deque
+from PySide6.QtCore import Qt, SLOT, QAbstractTableModel, QModelIndex, Signal, QTimer
+
+from ..core.download_manager import DownloadManager, NUMERIC_FIELDS, store_sort_numbers
+
+# Job dict key for each column (column 0 is the merged status/progress cell)
+_COL_KEYS = (None, 'title', 'artist', 'album', 'year', 'track', 'genre',
+             'album_artist', 'composer', 'disc_number', 'compilation')
+# Only the basic metadata columns are editable in the queue
+_EDITABLE_COLS = range(1, 7)
+# Statuses that can be removed from the queue (besides any 'Error: ...')
+_REMOVABLE = frozenset(('Pending', 'Done'))
+# What QAbstractTableModel.flags() returns for a valid cell, plus the editable variant
+_FLAGS_READONLY = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemNeverHasChildren
+_FLAGS_EDITABLE = _FLAGS_READONLY | Qt.ItemIsEditable
 
 class DownloadJobModel(QAbstractTableModel):
     COLUMNS = ["Status", "Title", "Artist", "Album", "Year", "Track", "Genre", "Album Artist", "Composer", "Disc", "Compilation"]
+    # Same alignment for every cell; combine the flags once
+    _ALIGN = Qt.AlignLeft | Qt.AlignVCenter
+    # Rows materialized per fetchMore() for very large imports
+    FETCH_BATCH = 200
     
     def __init__(self, jobs=None):
         super().__init__()
         # Jobs list of dicts
         self.jobs = jobs or []
+        # Rendered display strings per row ({col: text}), aligned with self.jobs.
+        # Any dataChanged for a row (including external job edits) drops its entry.
+        self._row_cache = [{} for _ in self.jobs]
+        self.dataChanged.connect(self._invalidate_rows)
+        for job in self.jobs:
+            store_sort_numbers(job)
+        # status -> set of rows, so button handlers don't scan every job
+        self._rows_by_status = defaultdict(set)
+        self._indexed_status = []
+        self._rebuild_status_index()
+        # id(job) -> row, so worker callbacks can find their row without list.index()
+        self._job_row = {id(job): row for row, job in enumerate(self.jobs)}
+        # Jobs from very large imports waiting for fetchMore()
+        self._staged_jobs = deque()
+        # Progress repaints are coalesced and flushed at most every 100 ms
+        self._pending_progress = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_progress)
 
     def rowCount(self, parent=QModelIndex()):
         return len(self.jobs)
@@ -23,133 +59,260 @@ class DownloadJobModel(QAbstractTableModel):
         return len(self.COLUMNS)
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid():
-            return None
-        
-        job = self.jobs[index.row()]
-        col = index.column()
-        
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            if col == 0: 
-                # Merged Status/Progress
-                s = job.get('status', 'Pending')
-                if s == 'Downloading':
-                    p = job.get('progress', 0)
-                    return f"{p:.1f}%"
-                return s
-            
-            mapping = {
-                1: 'title', 2: 'artist', 3: 'album', 4: 'year', 
-                5: 'track', 6: 'genre', 7: 'album_artist', 
-                8: 'composer', 9: 'disc_number', 10: 'compilation'
-            }
-            key = mapping.get(col)
-            if key:
-                val = job.get(key, '')
-                if key == 'compilation':
-                    return "1" if val in [True, 1, "1"] else "0"
-                return str(val)
+            if not index.isValid():
+                return None
+            row = index.row()
+            col = index.column()
+            cache = self._row_cache[row]
+            text = cache.get(col)
+            if text is None:
+                text = cache[col] = self._render(self.jobs[row], col)
+            return text
         
+        # Same for every cell, so no need to look at the index
         if role == Qt.TextAlignmentRole:
-            return Qt.AlignLeft | Qt.AlignVCenter
+            return self._ALIGN
 
         return None
 
+    def _render(self, job, col):
+        if col == 0: 
+            # Merged Status/Progress
+            s = job.get('status', 'Pending')
+            if s == 'Downloading':
+                p = job.get('progress', 0)
+                return f"{p:.1f}%"
+            return s
+        
+        key = _COL_KEYS[col]
+        val = job.get(key, '')
+        if key == 'compilation':
+            return "1" if val in [True, 1, "1"] else "0"
+        return str(val)
+
+    def _invalidate_rows(self, top_left, bottom_right, roles=()):
+        # Status-only updates (column 0) can't touch the numeric fields
+        metadata_changed = bottom_right.column() > 0
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._row_cache[row].clear()
+            if metadata_changed:
+                store_sort_numbers(self.jobs[row])
+
     def setData(self, index, value, role=Qt.EditRole):
         if role == Qt.EditRole:
             job = self.jobs[index.row()]
             col = index.column()
             # Allow editing metadata if Pending
-            if job.get('status') == 'Pending':
-                 key = None
-                 if col == 1: key = 'title'
-                 elif col == 2: key = 'artist'
-                 elif col == 3: key = 'album'
-                 elif col == 4: key = 'year'
-                 elif col == 5: key = 'track'
-                 elif col == 6: key = 'genre'
-                 
-                 if key:
-                     job[key] = value
-                     self.dataChanged.emit(index, index)
-                     return True
+            if job.get('status') == 'Pending' and col in _EDITABLE_COLS:
+                job[_COL_KEYS[col]] = value
+                self.dataChanged.emit(index, index)
+                return True
         return False
 
     def flags(self, index):
-        default = super().flags(index)
-        job = self.jobs[index.row()]
+        if not index.isValid():
+            return Qt.NoItemFlags
         # Editable if Pending and not Status column (0)
-        if job.get('status') == 'Pending' and index.column() > 0:
-            return default | Qt.ItemIsEditable
-        return default
+        if index.column() > 0 and self.jobs[index.row()].get('status') == 'Pending':
+            return _FLAGS_EDITABLE
+        return _FLAGS_READONLY
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
             return self.COLUMNS[section]
         return None
 
+    def _rebuild_status_index(self):
+        self._rows_by_status.clear()
+        self._indexed_status = [job.get('status') for job in self.jobs]
+        for row, status in enumerate(self._indexed_status):
+            self._rows_by_status[status].add(row)
+
+    def _set_status(self, row, status):
+        self.jobs[row]['status'] = status
+        self._rows_by_status[self._indexed_status[row]].discard(row)
+        self._rows_by_status[status].add(row)
+        self._indexed_status[row] = status
+
+    def row_for_job(self, job):
+        """Current row of a job dict, or None if it is no longer in the queue."""
+        return self._job_row.get(id(job))
+
+    def _reindex_rows(self, start=0):
+        for row in range(start, len(self.jobs)):
+            self._job_row[id(self.jobs[row])] = row
+
+    def rows_with_status(self, status):
+        # Callers act on the whole queue (Start all, Clear completed)
+        self._drain_staged()
+        return sorted(self._rows_by_status.get(status, ()))
+
     def add_jobs(self, new_jobs):
+        if not new_jobs:
+            return
+        if self._staged_jobs or len(new_jobs) > self.FETCH_BATCH:
+            # Huge imports show the first batch now and the rest as the view
+            # scrolls (fetchMore); anything already staged must stay ahead
+            if not self._staged_jobs:
+                self._insert_jobs(new_jobs[:self.FETCH_BATCH])
+                new_jobs = new_jobs[self.FETCH_BATCH:]
+            self._staged_jobs.extend(new_jobs)
+            return
+        self._insert_jobs(new_jobs)
+
+    def _insert_jobs(self, new_jobs):
         self.beginInsertRows(QModelIndex(), len(self.jobs), len(self.jobs) + len(new_jobs) - 1)
+        start = len(self.jobs)
         self.jobs.extend(new_jobs)
+        self._row_cache.extend({} for _ in new_jobs)
+        for row, job in enumerate(new_jobs, start):
+            if '_year_n' not in job: # Fetched jobs arrive with these precomputed
+                store_sort_numbers(job)
+            self._job_row[id(job)] = row
+            status = job.get('status')
+            self._indexed_status.append(status)
+            self._rows_by_status[status].add(row)
         self.endInsertRows()
 
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and bool(self._staged_jobs)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._staged_jobs:
+            return
+        count = min(self.FETCH_BATCH, len(self._staged_jobs))
+        self._insert_jobs([self._staged_jobs.popleft() for _ in range(count)])
+
+    def _drain_staged(self):
+        """Materialize every staged job (needed before whole-queue operations)."""
+        if self._staged_jobs:
+            staged = list(self._staged_jobs)
+            self._staged_jobs.clear()
+            self._insert_jobs(staged)
+
     def remove_jobs(self, rows):
+        if not rows:
+            return
+        # Pending progress rows are about to shift; repaint them first
+        self._flush_progress()
         # Rows should be sorted descending to avoid index shift issues
-        rows = sorted(rows, reverse=True)
+        rows = sorted(set(rows), reverse=True)
         for row in rows:
-            self.beginRemoveRows(QModelIndex(), row, row)
-            del self.jobs[row]
+            self._job_row.pop(id(self.jobs[row]), None)
+        
+        if len(rows) * 2 > len(self.jobs):
+            # Removing most of the queue; one reset is cheaper than many removes
+            self.beginResetModel()
+            drop = set(rows)
+            self.jobs[:] = [job for row, job in enumerate(self.jobs) if row not in drop]
+            self._row_cache = [{} for _ in self.jobs]
+            self._rebuild_status_index()
+            self._reindex_rows()
+            self.endResetModel()
+            return
+        
+        # Remove each run of consecutive rows with a single begin/end pair
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.jobs[first:last + 1]
+            del self._row_cache[first:last + 1]
             self.endRemoveRows()
+            i += 1
+        # Later rows shifted up, so the row indexes need renumbering
+        self._rebuild_status_index()
+        self._reindex_rows(rows[-1])
 
     def update_job_progress(self, row, progress):
-        self.jobs[row]['progress'] = progress
-        self.jobs[row]['status'] = 'Downloading'
-        if progress >= 100:
-            self.jobs[row]['status'] = 'Done'
-        # Emitting change for Status column (0)
-        self.dataChanged.emit(self.index(row, 0), self.index(row, 0))
+        job = self.jobs[row]
+        old_status = job.get('status')
+        old_progress = job.get('progress', 0)
+        job['progress'] = progress
+        self._set_status(row, 'Done' if progress >= 100 else 'Downloading')
+        # Progress callbacks fire many times a second; only repaint when the
+        # displayed text (one decimal place) or the status actually changes
+        if job['status'] == old_status and round(progress, 1) == round(old_progress, 1):
+            return
+        self._pending_progress.add(row)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_progress(self):
+        if not self._pending_progress:
+            return
+        rows = sorted(self._pending_progress)
+        self._pending_progress = set()
+        # One signal per run of consecutive dirty rows in the Status column (0);
+        # a single min..max span would drop the row cache of every row between
+        i = 0
+        while i < len(rows):
+            first = last = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == last + 1:
+                i += 1
+                last = rows[i]
+            self.dataChanged.emit(self.createIndex(first, 0), self.createIndex(last, 0),
+                                  [Qt.DisplayRole])
+            i += 1
 
     def update_job_status(self, row, status):
-        self.jobs[row]['status'] = status
-        self.dataChanged.emit(self.index(row, 0), self.index(row, 0))
+        self._set_status(row, status)
+        idx = self.createIndex(row, 0)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def update_rows(self, rows):
+        """Refresh whole rows, one dataChanged per run of consecutive rows."""
+        rows = sorted(set(rows))
+        last_col = self.columnCount() - 1
+        i = 0
+        while i < len(rows):
+            first = last = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == last + 1:
+                i += 1
+                last = rows[i]
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col))
+            i += 1
 
     def get_job(self, row):
         return self.jobs[row]
 
     def sort(self, column, order=Qt.AscendingOrder):
         """Sort model by a specific column."""
+        self._drain_staged()
+        self._flush_progress()
         self.layoutAboutToBeChanged.emit()
         
         reverse = (order == Qt.DescendingOrder)
         
-        def sort_key(job):
-            if column == 0: # Status
+        # Resolve the column once; sort() then calls the key once per job
+        key = _COL_KEYS[column] if 0 < column < len(_COL_KEYS) else None
+        
+        if column == 0: # Status
+            def sort_key(job):
                 return str(job.get('status', 'Pending')).lower()
-            
-            # Map columns to metadata keys
-            mapping = {
-                1: 'title', 2: 'artist', 3: 'album', 4: 'year', 
-                5: 'track', 6: 'genre', 7: 'album_artist', 
-                8: 'composer', 9: 'disc_number', 10: 'compilation'
-            }
-            key = mapping.get(column)
-            if not key: return ""
-            
-            val = job.get(key, "")
-            
-            # Special handling for numerical columns
-            if key in ['year', 'track', 'disc_number', 'compilation']:
-                try:
-                    s = str(val).split('/')[0]
-                    if key == 'compilation':
-                        return 1 if val in [True, 1, "1"] else 0
-                    return int(s) if s else 0
-                except:
-                    return 0
-                    
-            return str(val).lower()
+        elif not key:
+            def sort_key(job):
+                return ""
+        elif key == 'compilation':
+            def sort_key(job):
+                return 1 if job.get(key, "") in [True, 1, "1"] else 0
+        elif key in NUMERIC_FIELDS:
+            # Numerical columns were parsed when the job was added/edited
+            num_key = NUMERIC_FIELDS[key]
+            def sort_key(job):
+                return job[num_key]
+        else:
+            def sort_key(job):
+                return str(job.get(key, "")).lower()
 
         self.jobs.sort(key=sort_key, reverse=reverse)
+        self._row_cache = [{} for _ in self.jobs]
+        self._rebuild_status_index()
+        self._reindex_rows()
         self.layoutChanged.emit()
 
 
@@ -239,8 +402,6 @@ class DownloadQueue(QWidget):
         if not url: return
         
         # Show loader cursor
-        from PySide6.QtCore import Qt
-        from PySide6.QtWidgets import QApplication
         QApplication.setOverrideCursor(Qt.BusyCursor)
         self.btn_preload.setEnabled(False)
         self.edit_url.setEnabled(False)
@@ -249,32 +410,37 @@ class DownloadQueue(QWidget):
         worker = self.manager.fetch_info(url)
         self._active_fetchers.add(worker)
         
-        worker.finished.connect(lambda r, w=worker: self._on_fetch_finished(w, r))
-        worker.error.connect(lambda e, w=worker: self._on_fetch_error(w, e))
+        # The slots drop the worker from _active_fetchers via sender().
+        # Results are handed over from the worker thread, so queue explicitly.
+        worker.finished.connect(self._on_fetch_finished, Qt.QueuedConnection)
+        worker.error.connect(self._on_fetch_error, Qt.QueuedConnection)
         
         # Ensure cleanup
         worker.finished.connect(worker.deleteLater)
         worker.error.connect(worker.deleteLater)
-        # Also remove from set when deleted (or when finished)
-        worker.finished.connect(lambda: self._active_fetchers.discard(worker))
-        worker.error.connect(lambda: self._active_fetchers.discard(worker))
         
-    def _on_fetch_finished(self, worker, results):
+    def _on_fetch_finished(self, results):
+        self._active_fetchers.discard(self.sender())
         self._restore_cursor()
+        self.edit_url.clear()
         if not results:
              QMessageBox.warning(self, "Info", "No videos found.")
+             return
              
-        for job in results:
-            self.model.add_jobs([job])
-            
-        self.edit_url.clear()
+        # One insert for the whole playlist instead of a layout pass per video,
+        # with repaints held off until it is in
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.add_jobs(results)
+        finally:
+            self.table.setUpdatesEnabled(True)
     
-    def _on_fetch_error(self, worker, err_msg):
+    def _on_fetch_error(self, err_msg):
+        self._active_fetchers.discard(self.sender())
         self._restore_cursor()
         QMessageBox.warning(self, "Error", f"Fetch failed: {err_msg}")
 
     def _restore_cursor(self):
-        from PySide6.QtWidgets import QApplication
         QApplication.restoreOverrideCursor()
         self.btn_preload.setEnabled(True)
         self.edit_url.setEnabled(True)
@@ -283,10 +449,7 @@ class DownloadQueue(QWidget):
         indexes = self.table.selectionModel().selectedRows()
         if not indexes:
             # Fallback: Find all Pending
-            rows = []
-            for r in range(self.model.rowCount()):
-                if self.model.get_job(r)['status'] == 'Pending':
-                    rows.append(r)
+            rows = self.model.rows_with_status('Pending')
         else:
             rows = [i.row() for i in indexes]
 
@@ -308,8 +471,8 @@ class DownloadQueue(QWidget):
         rows_to_remove = []
         for idx in indexes:
             row = idx.row()
-            job = self.model.get_job(row)
-            if job['status'] == 'Pending' or job['status'] == 'Done' or str(job['status']).startswith('Error'):
+            status = str(self.model.get_job(row).get('status', ''))
+            if status in _REMOVABLE or status.startswith('Error'):
                 rows_to_remove.append(row)
             else:
                 # Active?
@@ -319,11 +482,7 @@ class DownloadQueue(QWidget):
             self.model.remove_jobs(rows_to_remove)
 
     def _clear_completed(self):
-        rows_to_remove = []
-        for r in range(self.model.rowCount()):
-            job = self.model.get_job(r)
-            if job['status'] == 'Done':
-                rows_to_remove.append(r)
+        rows_to_remove = self.model.rows_with_status('Done')
         
         if rows_to_remove:
             self.model.remove_jobs(rows_to_remove)
@@ -336,46 +495,48 @@ class DownloadQueue(QWidget):
         job = worker.job_data
         self.active_workers[worker] = job
         
-        worker.progress.connect(lambda p, w=worker: self._on_progress(w, p))
-        worker.download_finished.connect(lambda f, w=worker: self._on_finished(w, f))
-        worker.error.connect(lambda e, w=worker: self._on_error(w, e))
+        # Plain slots; the worker is recovered via sender() so no closures are needed
+        worker.progress.connect(self._on_progress)
+        worker.download_finished.connect(self._on_finished)
+        worker.error.connect(self._on_error)
         
         # Update UI to reflect it's now starting
-        try:
-            row = self.model.jobs.index(job)
+        row = self.model.row_for_job(job)
+        if row is not None:
             self.model.update_job_status(row, 'Starting...')
-        except ValueError:
-            pass
 
-    def _on_progress(self, worker, p):
-        if worker in self.active_workers:
-            job = self.active_workers[worker]
-            try:
-                row = self.model.jobs.index(job)
+    def _on_progress(self, p):
+        job = self.active_workers.get(self.sender())
+        if job is not None:
+            row = self.model.row_for_job(job)
+            if row is not None:
                 self.model.update_job_progress(row, p)
-            except ValueError:
-                pass
 
-    def _on_finished(self, worker, filename):
+    def _on_finished(self, filename):
+        worker = self.sender()
         if worker in self.active_workers:
             job = self.active_workers[worker]
-            try:
-                row = self.model.jobs.index(job)
+            row = self.model.row_for_job(job)
+            if row is not None:
                 self.model.update_job_status(row, 'Done')
-            except ValueError:
-                pass
             # cleanup
-            del self.active_workers[worker]
+            self._release_worker(worker)
 
-    def _on_error(self, worker, err):
+    def _on_error(self, err):
+        worker = self.sender()
         if worker in self.active_workers:
             job = self.active_workers[worker]
-            try:
-                row = self.model.jobs.index(job)
+            row = self.model.row_for_job(job)
+            if row is not None:
                 self.model.update_job_status(row, f"Error: {err}")
-            except ValueError:
-                pass
-            del self.active_workers[worker]
+            self._release_worker(worker)
+
+    def _release_worker(self, worker):
+        """Forget a finished worker and drop our connections to it."""
+        del self.active_workers[worker]
+        worker.progress.disconnect(self._on_progress)
+        worker.download_finished.disconnect(self._on_finished)
+        worker.error.disconnect(self._on_error)
 
     def _show_context_menu(self, pos):
         # Find which row is under the mouse
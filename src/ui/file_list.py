@@ -1,7 +1,8 @@
+import os
 from typing import List, Any
 from PySide6.QtWidgets import QTableView, QAbstractItemView, QHeaderView
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal, QMimeData
-from PySide6.QtGui import QDragEnterEvent, QDropEvent
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QKeySequence, QShortcut
 
 from ..core.track import Track
 
@@ -9,11 +10,24 @@ class TrackModel(QAbstractTableModel):
     """
     Model for displaying Track objects in a table.
     """
-    COLUMNS = ["Filename", "Title", "Artist", "Album", "Year", "Track", "Genre", "Album Artist", "Composer", "Disc", "Compilation"]
+    COLUMNS = ("Filename", "Title", "Artist", "Album", "Year", "Track", "Genre", "Album Artist", "Composer", "Disc", "Compilation")
+    # What QAbstractTableModel.flags() returns for a valid cell, plus the editable variant
+    _FLAGS_READONLY = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemNeverHasChildren
+    _FLAGS_EDITABLE = _FLAGS_READONLY | Qt.ItemIsEditable
+    # Same alignment for every cell; combine the flags once
+    _ALIGN = Qt.AlignLeft | Qt.AlignVCenter
     
     def __init__(self, tracks: List[Track] = None):
         super().__init__()
         self._tracks = tracks or []
+        # Rendered display strings per row ({col: text}), aligned with self._tracks.
+        # update_track()/setData emit dataChanged, which drops the row's entry.
+        self._row_cache = [{} for _ in self._tracks]
+        # file_path -> row; renames are picked up in _invalidate_rows, and a
+        # stale entry for an old path is rejected by row_for_path
+        self._path_row = {}
+        self._reindex_rows()
+        self.dataChanged.connect(self._invalidate_rows)
 
     def rowCount(self, parent=QModelIndex()):
         return len(self._tracks)
@@ -22,99 +36,121 @@ class TrackModel(QAbstractTableModel):
         return len(self.COLUMNS)
 
     def data(self, index, role=Qt.DisplayRole):
-        if not index.isValid():
-            return None
-
-        track = self._tracks[index.row()]
-        col = index.column()
-
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            if col == 0:
-                return track.filename
-            
-            # Map columns to metadata keys
-            key = self._get_key_for_col(col)
-            if key:
-                val = track.metadata.get(key, "")
-                if key == 'compilation':
-                    return "1" if val in [True, 1, "1"] else "0"
-                return str(val)
+            if not index.isValid():
+                return None
+            row = index.row()
+            col = index.column()
+            cache = self._row_cache[row]
+            text = cache.get(col)
+            if text is None:
+                text = cache[col] = self._render(self._tracks[row], col)
+            return text
 
+        # Same for every cell, so no need to look at the index
         if role == Qt.TextAlignmentRole:
-            return Qt.AlignLeft | Qt.AlignVCenter
+            return self._ALIGN
+
+        return None
+
+    def _render(self, track, col):
+        if col == 0:
+            return track.filename
+        
+        # Map columns to metadata keys (col comes from a valid index, so index directly)
+        key = self._KEY_FOR_COL[col]
+        val = track.metadata.get(key, "")
+        if key == 'compilation':
+            return "1" if val in [True, 1, "1"] else "0"
+        return str(val)
+
+    def _invalidate_rows(self, top_left, bottom_right, roles=()):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._row_cache[row].clear()
+            self._path_row[self._tracks[row].file_path] = row
 
+    def row_for_path(self, path):
+        """Row of the track at path, or None if it isn't loaded."""
+        row = self._path_row.get(path)
+        if row is not None and self._tracks[row].file_path == path:
+            return row
         return None
 
+    def _reindex_rows(self, start=0):
+        for row in range(start, len(self._tracks)):
+            self._path_row[self._tracks[row].file_path] = row
+
     def flags(self, index):
         if not index.isValid():
             return Qt.NoItemFlags
-        default = super().flags(index)
-        if index.column() == 0:
-            return default | Qt.ItemIsEditable
-        return default
+        # Only the filename column is editable (renames the file)
+        return self._FLAGS_EDITABLE if index.column() == 0 else self._FLAGS_READONLY
 
     def setData(self, index, value, role=Qt.EditRole):
         if role == Qt.EditRole and index.column() == 0:
             track = self._tracks[index.row()]
-            import os
             old_path = track.file_path
             new_name = value.strip()
             if not new_name:
                 return False
                 
-            dir_name = os.path.dirname(old_path)
-            new_path = os.path.join(dir_name, new_name)
-            
-            if old_path == new_path:
-                return False
-            
-            if os.path.exists(new_path):
+            if new_name == os.path.basename(old_path):
                 return False
+            new_path = os.path.join(os.path.dirname(old_path), new_name)
             
             try:
-                os.rename(old_path, new_path)
+                self._rename_no_clobber(old_path, new_path)
                 track.file_path = new_path
                 self.dataChanged.emit(index, index)
                 # Also notify that metadata columns might need refresh? 
                 # (Though they shouldn't change, just the filename)
                 return True
+            except FileExistsError:
+                return False
             except Exception as e:
                 print(f"Rename failed: {e}")
                 return False
         return False
 
+    @staticmethod
+    def _rename_no_clobber(old_path, new_path):
+        """Rename without overwriting; raises FileExistsError if new_path is taken."""
+        # Windows rename already refuses to replace an existing file; elsewhere
+        # one exists() check guards it
+        if os.name != 'nt' and os.path.exists(new_path):
+            raise FileExistsError(new_path)
+        os.rename(old_path, new_path)
+
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if role == Qt.DisplayRole:
             if orientation == Qt.Horizontal:
                 return self.COLUMNS[section]
         return None
 
+    # Maps column index to internal metadata key (column 0 is the filename)
+    _KEY_FOR_COL = (None, 'title', 'artist', 'album', 'year', 'track', 'genre',
+                    'album_artist', 'composer', 'disc_number', 'compilation')
+
     def _get_key_for_col(self, col):
-        # Maps column index to internal metadata key
-        mapping = {
-            1: 'title',
-            2: 'artist',
-            3: 'album',
-            4: 'year',
-            5: 'track',
-            6: 'genre',
-            7: 'album_artist',
-            8: 'composer',
-            9: 'disc_number',
-            10: 'compilation'
-        }
-        return mapping.get(col)
+        return self._KEY_FOR_COL[col] if 0 <= col < len(self._KEY_FOR_COL) else None
 
     def set_tracks(self, tracks: List[Track]):
         self.beginResetModel()
         self._tracks = tracks
+        self._row_cache = [{} for _ in tracks]
+        self._path_row = {}
+        self._reindex_rows()
         self.endResetModel()
 
-    def add_tracks(self, tracks: List[Track]):
+    def append_tracks(self, tracks: List[Track]):
+        """Append a chunk of tracks, inserting only the new rows."""
         if not tracks:
             return
-        self.beginInsertRows(QModelIndex(), len(self._tracks), len(self._tracks) + len(tracks) - 1)
+        start = len(self._tracks)
+        self.beginInsertRows(QModelIndex(), start, start + len(tracks) - 1)
         self._tracks.extend(tracks)
+        self._row_cache.extend({} for _ in tracks)
+        self._reindex_rows(start)
         self.endInsertRows()
 
     def remove_tracks(self, rows: List[int]):
@@ -123,10 +159,34 @@ class TrackModel(QAbstractTableModel):
             return
         
         # Sort in reverse to avoid index shifts
-        for row in sorted(rows, reverse=True):
-            self.beginRemoveRows(QModelIndex(), row, row)
-            self._tracks.pop(row)
+        rows = sorted(set(rows), reverse=True)
+        
+        if len(rows) * 2 > len(self._tracks):
+            # Removing most of the list; one reset is cheaper than many removes
+            self.beginResetModel()
+            drop = set(rows)
+            self._tracks = [t for row, t in enumerate(self._tracks) if row not in drop]
+            self._row_cache = [{} for _ in self._tracks]
+            self._path_row = {}
+            self._reindex_rows()
+            self.endResetModel()
+            return
+        
+        # Remove each run of consecutive rows with a single begin/end pair
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for track in self._tracks[first:last + 1]:
+                self._path_row.pop(track.file_path, None)
+            del self._tracks[first:last + 1]
+            del self._row_cache[first:last + 1]
             self.endRemoveRows()
+            i += 1
+        self._reindex_rows(rows[-1])
         
     def sort(self, column, order=Qt.AscendingOrder):
         """Sort model by a specific column."""
@@ -134,32 +194,41 @@ class TrackModel(QAbstractTableModel):
         
         reverse = (order == Qt.DescendingOrder)
         
-        def sort_key(track):
-            if column == 0: # Filename
+        # Resolve the column once; sort() then calls the key once per track
+        key = self._get_key_for_col(column)
+        
+        if column == 0: # Filename
+            def sort_key(track):
                 return track.filename.lower()
-            
-            key = self._get_key_for_col(column)
-            val = track.metadata.get(key, "")
-            
-            # Special handling for numerical columns
-            if key == 'track':
-                # Handle "1/10" or "01" or empty
+        elif key == 'track':
+            # Handle "1/10" or "01" or empty
+            def sort_key(track):
+                s = str(track.metadata.get(key, "")).split('/')[0]
                 try:
-                    s = str(val).split('/')[0]
                     return int(s) if s else 0
-                except:
+                except ValueError:
                     return 0
-            if key == 'year':
+        elif key == 'year':
+            def sort_key(track):
+                val = track.metadata.get(key, "")
                 try:
                     return int(val) if val else 0
-                except:
+                except (ValueError, TypeError):
                     return 0
-                    
-            return str(val).lower()
+        else:
+            def sort_key(track):
+                return str(track.metadata.get(key, "")).lower()
 
         self._tracks.sort(key=sort_key, reverse=reverse)
+        self._row_cache = [{} for _ in self._tracks]
+        self._reindex_rows()
         self.layoutChanged.emit()
 
+    @property
+    def tracks_view(self) -> List[Track]:
+        """The backing list, for hot loops that already hold valid rows. Don't mutate it."""
+        return self._tracks
+
     def get_track(self, index: int) -> Track:
         if 0 <= index < len(self._tracks):
             return self._tracks[index]
@@ -169,6 +238,26 @@ class TrackModel(QAbstractTableModel):
         """Notify views that a track has changed."""
         self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
 
+    def update_rows(self, rows):
+        """Like update_track for many rows, one dataChanged per run of consecutive rows."""
+        rows = sorted(set(rows))
+        if not rows:
+            return
+        last_col = self.columnCount() - 1
+        if len(rows) * 2 > len(self._tracks):
+            # Most of the table changed; one signal over the whole span is cheaper
+            # than many runs (the rows in between just re-render)
+            self.dataChanged.emit(self.index(rows[0], 0), self.index(rows[-1], last_col))
+            return
+        i = 0
+        while i < len(rows):
+            first = last = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == last + 1:
+                i += 1
+                last = rows[i]
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col))
+            i += 1
+
 
 class FileList(QTableView):
     """
@@ -196,6 +285,11 @@ class FileList(QTableView):
         # Drag & Drop
         self.setAcceptDrops(True)
         self.setDragDropMode(QAbstractItemView.DropOnly)
+        
+        # Delete/Backspace remove rows; WidgetShortcut keeps them out of the rename editor
+        for seq in (QKeySequence.Delete, QKeySequence(Qt.Key_Backspace)):
+            shortcut = QShortcut(seq, self, self._delete_selected)
+            shortcut.setContext(Qt.WidgetShortcut)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
@@ -219,12 +313,9 @@ class FileList(QTableView):
             self.files_dropped.emit(paths)
             event.acceptProposedAction()
 
-    def keyPressEvent(self, event):
-        if event.key() == Qt.Key_Backspace or event.key() == Qt.Key_Delete:
-            indexes = self.selectionModel().selectedRows()
-            if indexes:
-                rows = [idx.row() for idx in indexes]
-                self.model().remove_tracks(rows)
-            event.accept()
-        else:
-            super().keyPressEvent(event)
+    def _delete_selected(self):
+        """Remove the selected rows from the list (files stay on disk)."""
+        rows = {idx.row() for idx in self.selectionModel().selectedRows()}
+        if rows:
+            # remove_tracks batches contiguous rows into single removals
+            self.model().remove_tracks(sorted(rows))
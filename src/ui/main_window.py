@@ -1,20 +1,70 @@
 import os
+import sys
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
 from PySide6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QDockWidget, 
-                               QFileDialog, QStatusBar, QMessageBox, QVBoxLayout, QTabWidget)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
+                               QFileDialog, QStatusBar, QMessageBox, QVBoxLayout, QTabWidget,
+                               QProgressDialog, QDialog)
+from PySide6.QtCore import Qt, QThread, QThreadPool, QTimer, QItemSelection, Slot
+from PySide6.QtGui import QIcon, QAction
 
 from .file_list import FileList, TrackModel
 from .tag_editor import TagEditor
 from .download_queue import DownloadQueue
-from ..core.file_scanner import FileScanner
+from .dialogs import ConvertDialog, SettingsDialog, ColumnDialog
+from .discogs_dialog import DiscogsMatchDialog, AlbumMappingDialog, MetadataPreviewDialog, similarity_matrix
+from ..core.file_scanner import FileScanner, ScanWorker
+from ..core.tag_writer import SaveSignals, SaveJob
 from ..core.metadata_manager import MetadataManager
 from ..core.download_manager import DownloadManager
-from ..core.track import Track
 from ..core.utils import resource_path
 from ..core.discogs_manager import DiscogsManager
 
+log = logging.getLogger(__name__)
+
+def _most_common(values):
+    """Most frequent value ('' if empty); ties go to the first seen, like Counter."""
+    counts = {}
+    for v in values:
+        counts[v] = counts.get(v, 0) + 1
+    return max(counts, key=counts.__getitem__) if counts else ''
+
+def _best_track(row_scores, local_duration, remote_durations):
+    """
+    Picks the tracklist entry for one file from its title scores, boosting
+    entries whose duration matches. Returns (index or None, score).
+    """
+    if local_duration <= 0:
+        # No duration to weigh in; the best title score wins outright
+        if not row_scores:
+            return None, 0.0
+        idx = max(range(len(row_scores)), key=row_scores.__getitem__)
+        return (idx, row_scores[idx]) if row_scores[idx] > 0.0 else (None, 0.0)
+    
+    best_idx = None
+    best_score = 0.0
+    for idx, (score, dt_duration) in enumerate(zip(row_scores, remote_durations)):
+        # Boost score if duration matches (within 4 seconds)
+        if dt_duration > 0:
+            diff = abs(local_duration - dt_duration)
+            if diff <= 4:
+                score += 0.4 # Significant boost
+                if score > 1.0: score = 1.0
+            elif diff > 15:
+                score -= 0.2 # Penalty for large duration mismatch
+        
+        if score > best_score:
+            best_score = score
+            best_idx = idx
+    return best_idx, best_score
+
 class MainWindow(QMainWindow):
+    UNDO_LIMIT = 50
+    # Each Discogs search makes many API calls; more at once trips the rate limit
+    MAX_PARALLEL_SEARCHES = 3
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Nexus Music Tag & Downloader")
@@ -28,9 +78,22 @@ class MainWindow(QMainWindow):
         from ..core.settings_manager import SettingsManager
         self.settings = SettingsManager()
         self.scanner = FileScanner()
+        self._active_scans = set()  # ScanSignals of the scan currently feeding the model
+        self._scanned_count = 0
+        # Tag writes get their own bounded pool so they leave cores for the UI and scans
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 2))
+        self._save_batches = {}  # SaveSignals -> progress of that save batch
+        # One write per file at a time: path -> SaveJobs waiting behind the running one
+        self._writes = {}
         self.metadata_manager = MetadataManager()
         self.download_manager = DownloadManager(self.settings)
-        self.discogs_manager = DiscogsManager(self.settings.discogs_token)
+        self._discogs_manager = None  # built on first Discogs match
+        self._album_search = None  # (worker, progress, tracks_data, artist, album) while searching
+        self._individual_batch = None  # (tracks_data, release_ids, search results by index)
+        self._individual_searches = {}  # running search worker -> track index
+        self._individual_queue = deque()  # (worker, track index) not started yet
+        self._abandoned_searches = set()  # canceled workers, kept alive until they return
         
         # Models
         self.track_model = TrackModel()
@@ -53,8 +116,9 @@ class MainWindow(QMainWindow):
         self.file_list.setModel(self.track_model)
         self.tabs.addTab(self.file_list, "Library")
         
-        self.download_queue = DownloadQueue(self.download_manager)
-        self.tabs.addTab(self.download_queue, "Downloads")
+        # The Downloads tab is a placeholder until it is first opened
+        self.download_queue = None
+        self.tabs.addTab(QWidget(), "Downloads")
         
         self.splitter.addWidget(self.tabs)
         
@@ -68,10 +132,28 @@ class MainWindow(QMainWindow):
         
         # Save order when manually moved in the view
         self.file_list.horizontalHeader().sectionMoved.connect(self._on_column_moved)
-        self.download_queue.table.horizontalHeader().sectionMoved.connect(self._on_column_moved)
 
-        # Undo Stack
-        self.undo_stack = []
+        # Undo Stack (oldest batches drop off past UNDO_LIMIT)
+        self.undo_stack = deque(maxlen=self.UNDO_LIMIT)
+        
+        # Rubber-band selects fire selectionChanged per row; refresh the editor
+        # once the selection settles
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(30)
+        self._selection_timer.timeout.connect(self._apply_current_selection)
+        
+        # Failed saves report back one by one; repaint their reverted rows in batches
+        self._saved_paths = set()
+        self._saved_rows_timer = QTimer(self)
+        self._saved_rows_timer.setSingleShot(True)
+        self._saved_rows_timer.setInterval(50)
+        self._saved_rows_timer.timeout.connect(self._refresh_saved_rows)
+        
+        # Selected row numbers, cached until the selection or row order changes
+        self._library_rows_cache = None
+        self._download_rows_cache = None
+        self._watch_row_changes(self.track_model, self._invalidate_library_rows)
         
         # Connect signals
         self.tabs.currentChanged.connect(self._on_tab_changed)
@@ -80,69 +162,124 @@ class MainWindow(QMainWindow):
         self.file_list.files_dropped.connect(self.load_paths)
         self.file_list.selectionModel().selectionChanged.connect(self._on_library_selection)
         
-        # Downloads Signals
-        self.download_queue.table.selectionModel().selectionChanged.connect(self._on_download_selection)
-        
         # Editor Signals
         self.tag_editor.save_clicked.connect(self._on_save_tags)
         
         # Menu
         self._create_menu()
 
+    @property
+    def discogs_manager(self):
+        if self._discogs_manager is None:
+            self._discogs_manager = DiscogsManager(self.settings.discogs_token)
+        return self._discogs_manager
+
+    def _ensure_download_queue(self):
+        """Builds the Downloads tab the first time it is needed."""
+        if self.download_queue is not None:
+            return
+        self.download_queue = DownloadQueue(self.download_manager)
+        
+        # Swap out the placeholder without re-entering _on_tab_changed
+        current = self.tabs.currentIndex()
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(1)
+        self.tabs.removeTab(1)
+        self.tabs.insertTab(1, self.download_queue, "Downloads")
+        self.tabs.setCurrentIndex(current)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        self._apply_download_column_visibility()
+        self.download_queue.table.horizontalHeader().sectionMoved.connect(self._on_column_moved)
+        self._watch_row_changes(self.download_queue.model, self._invalidate_download_rows)
+        self.download_queue.table.selectionModel().selectionChanged.connect(self._on_download_selection)
+
+    @staticmethod
+    def _watch_row_changes(model, slot):
+        for sig in (model.layoutChanged, model.modelReset, model.rowsInserted, model.rowsRemoved):
+            sig.connect(slot)
+
     def _create_menu(self):
-        menu_file = self.menuBar().addMenu("&File")
+        # Only the menu titles exist up front; each menu is filled on first show.
+        # Actions with shortcuts (or state toggled elsewhere) are created here and
+        # added to the window so their shortcuts work before any menu is opened.
+        self.action_undo = self._window_action("Undo", self.undo, "Ctrl+Z")
+        self.action_undo.setEnabled(False)
         
+        self.action_clear_undo = QAction("Clear Undo History", self)
+        self.action_clear_undo.setEnabled(False)
+        self.action_clear_undo.triggered.connect(self._clear_undo_history)
+        
+        self.action_discogs_smart = self._window_action("Smart &Match...", self._on_match_discogs_smart, "Ctrl+D")
+        self.action_tag_to_name = self._window_action("Tag - Filename", self._on_tag_to_filename, "Alt+1")
+        self.action_name_to_tag = self._window_action("Filename - Tag", self._on_filename_to_tag, "Alt+2")
+        
+        self._menu_builders = {}
+        for title, builder in (("&File", self._build_file_menu),
+                               ("&Edit", self._build_edit_menu),
+                               ("&Convert", self._build_convert_menu),
+                               ("&Tools", self._build_tools_menu),
+                               ("&Help", self._build_help_menu)):
+            menu = self.menuBar().addMenu(title)
+            self._menu_builders[menu] = builder
+            menu.aboutToShow.connect(self._on_menu_about_to_show)
+
+    def _window_action(self, text, slot, shortcut):
+        action = QAction(text, self)
+        action.setShortcut(shortcut)
+        action.triggered.connect(slot)
+        self.addAction(action)
+        return action
+
+    @Slot()
+    def _on_menu_about_to_show(self):
+        menu = self.sender()
+        builder = self._menu_builders.pop(menu, None)
+        if builder is not None:
+            builder(menu)
+
+    def _build_file_menu(self, menu_file):
         action_open_dir = menu_file.addAction("Add Directory...")
         action_open_dir.triggered.connect(self._open_directory_dialog)
         
         menu_file.addSeparator()
         action_exit = menu_file.addAction("Exit")
         action_exit.triggered.connect(self.close)
-        
-        menu_edit = self.menuBar().addMenu("&Edit")
-        self.action_undo = menu_edit.addAction("Undo")
-        self.action_undo.setShortcut("Ctrl+Z")
-        self.action_undo.setEnabled(False)
-        self.action_undo.triggered.connect(self.undo)
+
+    def _build_edit_menu(self, menu_edit):
+        menu_edit.addAction(self.action_undo)
+        menu_edit.addAction(self.action_clear_undo)
         
         menu_edit.addSeparator()
         
         # Discogs Sub-Menu
         menu_discogs = menu_edit.addMenu("Match with &Discogs")
-        
-        action_discogs_smart = menu_discogs.addAction("Smart &Match...")
-        action_discogs_smart.setShortcut("Ctrl+D")
-        action_discogs_smart.triggered.connect(self._on_match_discogs_smart)
-        
-        menu_convert = self.menuBar().addMenu("&Convert")
-        action_tag_to_name = menu_convert.addAction("Tag - Filename")
-        action_tag_to_name.setShortcut("Alt+1")
-        action_tag_to_name.triggered.connect(self._on_tag_to_filename)
-        
-        action_name_to_tag = menu_convert.addAction("Filename - Tag")
-        action_name_to_tag.setShortcut("Alt+2")
-        action_name_to_tag.triggered.connect(self._on_filename_to_tag)
-        
-        menu_tools = self.menuBar().addMenu("&Tools")
+        menu_discogs.addAction(self.action_discogs_smart)
+
+    def _build_convert_menu(self, menu_convert):
+        menu_convert.addAction(self.action_tag_to_name)
+        menu_convert.addAction(self.action_name_to_tag)
+
+    def _build_tools_menu(self, menu_tools):
         action_settings = menu_tools.addAction("&Settings")
-        from PySide6.QtGui import QAction
         action_settings.setMenuRole(QAction.NoRole) # Prevent macOS from moving it to App menu
         action_settings.triggered.connect(self._on_open_settings)
         
         action_columns = menu_tools.addAction("Set &Columns...")
         action_columns.triggered.connect(self._on_set_columns)
-        
-        menu_help = self.menuBar().addMenu("&Help")
+
+    def _build_help_menu(self, menu_help):
         action_about = menu_help.addAction("&About")
         action_about.triggered.connect(self._on_about)
 
+    @Slot()
     def _on_open_settings(self):
-        from .dialogs import SettingsDialog
         dialog = SettingsDialog(self)
         dialog.exec()
 
+    @Slot()
     def _on_set_columns(self):
-        from .dialogs import ColumnDialog
         if self.tabs.currentIndex() == 0:
             # Library
             meta = self.settings.column_metadata_library
@@ -151,6 +288,7 @@ class MainWindow(QMainWindow):
             dialog = ColumnDialog("Library Columns", all_cols, visible, self)
             if dialog.exec():
                 self.settings.column_metadata_library = dialog.get_column_state()
+                self.settings.header_state_library = None
                 self._apply_column_visibility()
         else:
             # Downloads
@@ -160,10 +298,11 @@ class MainWindow(QMainWindow):
             dialog = ColumnDialog("Downloads Columns", all_cols, visible, self)
             if dialog.exec():
                 self.settings.column_metadata_downloads = dialog.get_column_state()
+                self.settings.header_state_downloads = None
                 self._apply_column_visibility()
 
+    @Slot()
     def _on_about(self):
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.about(self, "About Nexus",
             "<h3>Nexus Music Tag & Downloader</h3>"
             "<p>Version <b>1.0.0</b></p>"
@@ -171,16 +310,11 @@ class MainWindow(QMainWindow):
             "<p>A high-performance tool for music enthusiasts, combining "
             "YouTube downloading with advanced metadata management.</p>")
 
+    @Slot()
     def _on_match_discogs_smart(self):
         """
         Smartly determines whether to match as a single track, an album, or a batch of individual tracks.
         """
-        from PySide6.QtWidgets import QMessageBox, QProgressDialog, QDialog
-        from PySide6.QtCore import QEventLoop, Qt
-        from .discogs_dialog import DiscogsMatchDialog, AlbumMappingDialog, MetadataPreviewDialog
-        from difflib import SequenceMatcher
-        import os
-        from collections import Counter
 
         # 1. Validation
         if not self.settings.discogs_token:
@@ -191,7 +325,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Not Supported", "Discogs matching is only for Library tracks.")
             return
 
-        selected_rows = self.file_list.selectionModel().selectedRows()
+        selected_rows = self._library_rows()
         if not selected_rows:
             QMessageBox.information(self, "No Selection", "Please select tracks to match.")
             return
@@ -200,32 +334,36 @@ class MainWindow(QMainWindow):
 
         # 2. Analyze Selection
         tracks_data = []
+        artists = []  # non-empty values only, for the common artist/album guess
+        albums = []
+        tracks = self.track_model.tracks_view
         for row in selected_rows:
-            track = self.track_model.get_track(row.row())
-            if track:
-                # Always attempt to augment missing metadata from filename
-                guessed = self.metadata_manager.guess_metadata_from_filename(track.file_path)
-                for k, v in guessed.items():
-                    if not track.metadata.get(k):
-                        track.metadata[k] = v
-
-                tracks_data.append({
-                    'track': track,
-                    'artist': track.metadata.get('artist', '') or '',
-                    'album': track.metadata.get('album', '') or '',
-                    'title': track.metadata.get('title', '') or track.filename,
-                    'row': row.row()
-                })
+            track = tracks[row]
+            meta = track.metadata
+            # Always attempt to augment missing metadata from filename
+            guessed = self.metadata_manager.guess_metadata_from_filename(track.file_path)
+            for k, v in guessed.items():
+                if not meta.get(k):
+                    meta[k] = v
+
+            artist = meta.get('artist') or ''
+            album = meta.get('album') or ''
+            if artist: artists.append(artist)
+            if album: albums.append(album)
+            tracks_data.append({
+                'track': track,
+                'artist': artist,
+                'album': album,
+                'title': meta.get('title') or track.filename,
+                'row': row
+            })
 
         is_album_mode = False
         
         # Heuristic: If multiple tracks, ask user intent based on metadata consistency
         if len(tracks_data) > 1:
-            artists = [t['artist'] for t in tracks_data if t['artist']]
-            albums = [t['album'] for t in tracks_data if t['album']]
-            
-            common_artist = Counter(artists).most_common(1)[0][0] if artists else ''
-            common_album = Counter(albums).most_common(1)[0][0] if albums else ''
+            common_artist = _most_common(artists)
+            common_album = _most_common(albums)
             
             msg = f"You have selected {len(tracks_data)} tracks.\n"
             if common_album:
@@ -253,24 +391,16 @@ class MainWindow(QMainWindow):
 
         # 3. Execution
         if is_album_mode:
-            self._process_album_match(tracks_data)
+            self._process_album_match(tracks_data, common_artist, common_album)
         else:
             self._process_individual_match(tracks_data)
 
-    def _process_album_match(self, tracks_data):
-        from PySide6.QtWidgets import QMessageBox, QProgressDialog, QDialog
-        from PySide6.QtCore import QEventLoop, Qt
-        from .discogs_dialog import DiscogsMatchDialog, AlbumMappingDialog
-        from difflib import SequenceMatcher
-        import os
-        from collections import Counter
+    def _process_album_match(self, tracks_data, common_artist, common_album):
+        if self._album_search is not None:
+            self.status_bar.showMessage("A Discogs search is already running.", 3000)
+            return
         
         # 1. Determine Search Query
-        artists = [t['artist'] for t in tracks_data if t['artist']]
-        albums = [t['album'] for t in tracks_data if t['album']]
-        common_artist = Counter(artists).most_common(1)[0][0] if artists else ''
-        common_album = Counter(albums).most_common(1)[0][0] if albums else ''
-        
         query_artist = common_artist
         query_album = common_album
         
@@ -284,9 +414,9 @@ class MainWindow(QMainWindow):
         if not query_album and tracks_data:
              # Fallback: Use the first track's title to find the album
              query_track = tracks_data[0]['title']
-             print(f"Album Match: Missing album name. Probing using track: {query_track}")
+             log.debug("Album Match: Missing album name. Probing using track: %s", query_track)
 
-        print(f"Album Match: Searching for '{query_artist} - {query_album}' (Track: {query_track})")
+        log.debug("Album Match: Searching for '%s - %s' (Track: %s)", query_artist, query_album, query_track)
         
         # 2. Search Discogs
         worker = self.discogs_manager.search_async(query_artist, query_track, query_album)
@@ -298,16 +428,49 @@ class MainWindow(QMainWindow):
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
         
-        loop = QEventLoop()
-        matches = []
-        
-        worker.finished.connect(lambda res: (matches.extend(res), loop.quit()))
-        worker.error.connect(lambda err: (print(f"Search error: {err}"), loop.quit()))
+        # Matching continues in _on_album_search_finished once the worker reports
+        self._album_search = (worker, progress, tracks_data, query_artist, query_album)
+        worker.finished.connect(self._on_album_search_finished)
+        worker.error.connect(self._on_album_search_error)
+        progress.canceled.connect(self._on_album_search_canceled)
         worker.start()
-        
-        loop.exec()
+
+    @Slot(list)
+    def _on_album_search_finished(self, matches):
+        if self._album_search is None or self.sender() is not self._album_search[0]:
+            return
+        worker, progress, tracks_data, query_artist, query_album = self._album_search
+        self._album_search = None
+        worker.wait()
         progress.close()
-        
+        self._continue_album_match(tracks_data, query_artist, query_album, matches)
+
+    @Slot(str)
+    def _on_album_search_error(self, err):
+        print(f"Search error: {err}")
+        self._on_album_search_finished([])
+
+    @Slot()
+    def _on_album_search_canceled(self):
+        if self._album_search is None:
+            return
+        worker = self._album_search[0]
+        self._album_search = None
+        worker.finished.disconnect(self._on_album_search_finished)
+        worker.error.disconnect(self._on_album_search_error)
+        # The search can't be interrupted; hold the thread until it returns
+        self._abandoned_searches.add(worker)
+        worker.finished.connect(self._on_abandoned_search_done)
+        worker.error.connect(self._on_abandoned_search_done)
+
+    @Slot()
+    def _on_abandoned_search_done(self):
+        worker = self.sender()
+        if worker in self._abandoned_searches:
+            worker.wait()
+            self._abandoned_searches.discard(worker)
+
+    def _continue_album_match(self, tracks_data, query_artist, query_album, matches):
         if not matches:
             QMessageBox.information(self, "No Matches", f"No album found for:\n{query_artist} - {query_album}")
             return
@@ -332,39 +495,21 @@ class MainWindow(QMainWindow):
         # Pre-calculate scores to suggest best mapping
         # Create a pool of discogs tracks
         available_d_tracks = list(discogs_tracks)
+        # Title similarity for every file x tracklist pair in one batch
+        title_scores = similarity_matrix([t['title'] for t in tracks_data],
+                                         [dt['title'] for dt in available_d_tracks])
+        remote_durations = [dt.get('duration_seconds', 0) for dt in available_d_tracks]
         
-        for tdata in tracks_data:
-            local_title = tdata['title']
+        for tdata, row_scores in zip(tracks_data, title_scores):
             local_duration = float(tdata['track'].metadata.get('duration', 0))
-            best_match = None
-            best_score = 0.0
             
             # Find best match in available tracks
-            for i, dt in enumerate(available_d_tracks):
-                dt_title = dt['title']
-                
-                # Check position too if available? 
-                # For now just title similarity
-                score = SequenceMatcher(None, local_title.lower(), dt_title.lower()).ratio()
-                
-                # Boost score if duration matches (within 4 seconds)
-                dt_duration = dt.get('duration_seconds', 0)
-                if local_duration > 0 and dt_duration > 0:
-                    diff = abs(local_duration - dt_duration)
-                    if diff <= 4:
-                        score += 0.4 # Significant boost
-                        if score > 1.0: score = 1.0
-                    elif diff > 15:
-                        score -= 0.2 # Penalty for large duration mismatch
-                
-                if score > best_score:
-                    best_score = score
-                    best_match = dt
+            best_idx, best_score = _best_track(row_scores, local_duration, remote_durations)
             
             # If match is decent, assign it and remove from pool to prevent duplicates
             d_track = None
             if best_score > 0.4: # Low threshold, user will verify
-                d_track = best_match
+                d_track = available_d_tracks[best_idx]
                 # We generally don't remove from pool because sometimes user has duplicates or different versions
                 # But for 1-to-1 mapping it's better. Let's keep it simple for now.
             
@@ -382,6 +527,9 @@ class MainWindow(QMainWindow):
             return
             
         final_mapping = map_dialog.get_mapping()
+        # Library saves may have started while the dialogs were open
+        if self._saves_pending():
+            return
         
         # 7. Apply Changes
         # Download cover once
@@ -392,6 +540,7 @@ class MainWindow(QMainWindow):
                 artwork_path = temp_cover
         
         success_count = 0
+        updated_rows = []
         for item in final_mapping:
             track = item['track']
             d_track = item['discogs_track']
@@ -423,8 +572,10 @@ class MainWindow(QMainWindow):
                 track.metadata['artist'] = track_artist
             
             if self.metadata_manager.save_tags(track.file_path, track.metadata, artwork_path):
-                self.track_model.update_track(item['row'])
+                updated_rows.append(item['row'])
                 success_count += 1
+        # Refresh the table once for the whole album
+        self.track_model.update_rows(updated_rows)
                 
         if artwork_path and os.path.exists(artwork_path):
             os.remove(artwork_path)
@@ -433,35 +584,89 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "Success", f"Updated {success_count} tracks.")
 
     def _process_individual_match(self, tracks_data):
-        from PySide6.QtWidgets import QMessageBox, QProgressDialog, QDialog
-        from PySide6.QtCore import QEventLoop, Qt
-        from .discogs_dialog import DiscogsMatchDialog, MetadataPreviewDialog
-        import os
+        if self._individual_searches or self._individual_queue:
+            self.status_bar.showMessage("A Discogs search is already running.", 3000)
+            return
+        
+        auto_match_cache = {}  # (artist, title) -> release_id
+        release_ids = []
+        workers = {}
         
         for i, tdata in enumerate(tracks_data):
-            track = tdata['track']
             artist = tdata['artist']
             title = tdata['title']
-            album = tdata['album']
             
             # 1. Try Auto-Match
-            release_id = self.discogs_manager.auto_match(artist, title)
+            key = (artist, title)
+            if key not in auto_match_cache:
+                auto_match_cache[key] = self.discogs_manager.auto_match(artist, title)
+            release_id = auto_match_cache[key]
+            release_ids.append(release_id)
             
             # 2. If no auto-match, search manually
             if not release_id:
-                # Search
                 # Pass album and catalog number if available to help find the release
-                cat_no = track.metadata.get('catalog_number', '')
-                worker = self.discogs_manager.search_async(artist, title, album, cat_no)
-                if not worker: continue
-                
-                # Show generic progress
-                loop = QEventLoop()
-                matches = []
-                worker.finished.connect(lambda res: (matches.extend(res), loop.quit()))
-                worker.error.connect(lambda err: loop.quit())
-                worker.start()
-                loop.exec()
+                cat_no = tdata['track'].metadata.get('catalog_number', '')
+                worker = self.discogs_manager.search_async(artist, title, tdata['album'], cat_no)
+                if worker:
+                    workers[worker] = i
+        
+        self._individual_batch = (tracks_data, release_ids, {})
+        if not workers:
+            self._continue_individual_match()
+            return
+        
+        # Searches overlap, a few at a time; matching resumes when the last one reports
+        self.status_bar.showMessage(f"Searching Discogs for {len(workers)} tracks...")
+        self._individual_queue.extend(workers.items())
+        for _ in range(self.MAX_PARALLEL_SEARCHES):
+            self._start_next_individual_search()
+
+    def _start_next_individual_search(self):
+        if not self._individual_queue:
+            return
+        worker, i = self._individual_queue.popleft()
+        self._individual_searches[worker] = i
+        worker.finished.connect(self._on_individual_search_finished)
+        worker.error.connect(self._on_individual_search_error)
+        worker.start()
+
+    @Slot(list)
+    def _on_individual_search_finished(self, matches):
+        worker = self.sender()
+        i = self._individual_searches.pop(worker, None)
+        if i is None:
+            return
+        worker.wait()
+        self._individual_batch[2][i] = matches
+        self._start_next_individual_search()
+        if not self._individual_searches:
+            self.status_bar.clearMessage()
+            self._continue_individual_match()
+
+    @Slot(str)
+    def _on_individual_search_error(self, err):
+        print(f"Search error: {err}")
+        self._on_individual_search_finished([])
+
+    def _continue_individual_match(self):
+        tracks_data, release_ids, search_results = self._individual_batch
+        self._individual_batch = None
+        # Tracks from the same release hit the same lookups; cache them for this batch only
+        release_cache = {}  # release_id -> release_data
+        cover_cache = {}  # release_id -> local artwork path (None if unavailable)
+        accepted = []  # (tdata, proposed tags, artwork path), written after the last preview
+        
+        for i, tdata in enumerate(tracks_data):
+            track = tdata['track']
+            artist = tdata['artist']
+            title = tdata['title']
+            album = tdata['album']
+            release_id = release_ids[i]
+            
+            if not release_id:
+                if i not in search_results: continue  # search could not be started
+                matches = search_results[i]
                 
                 if matches:
                     dialog = DiscogsMatchDialog(matches, self, query_info=f"{artist} - {title}")
@@ -474,11 +679,13 @@ class MainWindow(QMainWindow):
                     continue
             
             if not release_id:
-                print(f"Skipping {title} - no match selected")
+                log.debug("Skipping %s - no match selected", title)
                 continue
                 
             # 3. Fetch Data
-            release_data = self.discogs_manager.get_release_data(release_id)
+            if release_id not in release_cache:
+                release_cache[release_id] = self.discogs_manager.get_release_data(release_id)
+            release_data = release_cache[release_id]
             if not release_data: continue
             
             # 4. Propose Changes
@@ -488,12 +695,11 @@ class MainWindow(QMainWindow):
                 
             # Track/Title logic
             # Try to match specific track in release
-            from difflib import SequenceMatcher
             best_match = None
             best_score = 0.0
-            for dt in release_data.get('tracklist', []):
-                dt_title = dt.get('title', '')
-                score = SequenceMatcher(None, title.lower(), dt_title.lower()).ratio()
+            tracklist = release_data.get('tracklist', [])
+            scores = similarity_matrix([title], [dt.get('title', '') for dt in tracklist])[0]
+            for dt, score in zip(tracklist, scores):
                 if score > best_score:
                     best_score = score
                     best_match = dt
@@ -521,23 +727,30 @@ class MainWindow(QMainWindow):
             # 5. Preview
             preview = MetadataPreviewDialog(track.metadata, proposed, track.filename, self)
             if preview.exec() == QDialog.Accepted:
-                # Apply
+                # Cover Art: download once per release, shared by its tracks
+                if release_id not in cover_cache:
+                    cover_cache[release_id] = None
+                    if release_data.get('cover_image'):
+                        temp_cover = f"temp_cover_{release_id}.jpg"
+                        if self.discogs_manager.download_cover_art(release_data['cover_image'], temp_cover):
+                            cover_cache[release_id] = temp_cover
+                accepted.append((tdata, proposed, cover_cache[release_id]))
+        
+        # Library saves may have started while the dialogs were open
+        updated_rows = []
+        if accepted and not self._saves_pending():
+            for tdata, proposed, artwork_path in accepted:
+                track = tdata['track']
                 for k, v in proposed.items():
                     if v: track.metadata[k] = str(v)
-                
-                # Cover Art
-                artwork_path = None
-                if release_data.get('cover_image'):
-                    temp_cover = f"temp_cover_{i}.jpg"
-                    if self.discogs_manager.download_cover_art(release_data['cover_image'], temp_cover):
-                        artwork_path = temp_cover
-                        
                 self.metadata_manager.save_tags(track.file_path, track.metadata, artwork_path)
-                self.track_model.update_track(tdata['row'])
-                
-                if artwork_path and os.path.exists(artwork_path):
-                    os.remove(artwork_path)
+                updated_rows.append(tdata['row'])
+                    
+        for artwork_path in cover_cache.values():
+            if artwork_path and os.path.exists(artwork_path):
+                os.remove(artwork_path)
                     
+        self.track_model.update_rows(updated_rows)
         self._on_library_selection(self.file_list.selectionModel().selection(), None)
 
 
@@ -547,6 +760,9 @@ class MainWindow(QMainWindow):
         header_lib = self.file_list.horizontalHeader()
         header_lib.blockSignals(True) # Prevent saving while restoring
         all_cols_lib = self.track_model.COLUMNS
+        # A saved header state restores the whole order at once
+        state = self.settings.header_state_library
+        restored = state is not None and header_lib.restoreState(state)
         
         for visual_idx, entry in enumerate(meta_lib):
             name = entry['name']
@@ -554,17 +770,23 @@ class MainWindow(QMainWindow):
             try:
                 logical_idx = all_cols_lib.index(name)
                 current_visual = header_lib.visualIndex(logical_idx)
-                if current_visual != visual_idx:
+                if not restored and current_visual != visual_idx:
                     header_lib.moveSection(current_visual, visual_idx)
                 self.file_list.setColumnHidden(logical_idx, not visible)
             except ValueError: pass
         header_lib.blockSignals(False)
-            
-        # 2. Downloads
+        
+        self._apply_download_column_visibility()
+
+    def _apply_download_column_visibility(self):
+        if self.download_queue is None:
+            return
         meta_dl = self.settings.column_metadata_downloads
         header_dl = self.download_queue.table.horizontalHeader()
         header_dl.blockSignals(True)
         all_cols_dl = self.download_queue.model.COLUMNS
+        state = self.settings.header_state_downloads
+        restored = state is not None and header_dl.restoreState(state)
         
         for visual_idx, entry in enumerate(meta_dl):
             name = entry['name']
@@ -572,12 +794,13 @@ class MainWindow(QMainWindow):
             try:
                 logical_idx = all_cols_dl.index(name)
                 current_visual = header_dl.visualIndex(logical_idx)
-                if current_visual != visual_idx:
+                if not restored and current_visual != visual_idx:
                     header_dl.moveSection(current_visual, visual_idx)
                 self.download_queue.table.setColumnHidden(logical_idx, not visible)
             except ValueError: pass
         header_dl.blockSignals(False)
 
+    @Slot()
     def _on_column_moved(self):
         # Determine which table moved and update its metadata
         # (Actually we can just update both or check sender)
@@ -592,8 +815,11 @@ class MainWindow(QMainWindow):
             visible = not self.file_list.isColumnHidden(l_idx)
             new_meta_lib.append({'name': name, 'visible': visible})
         self.settings.column_metadata_library = new_meta_lib
+        self.settings.header_state_library = header_lib.saveState()
         
-        # Downloads
+        # Downloads (nothing to record until the tab has been built)
+        if self.download_queue is None:
+            return
         header_dl = self.download_queue.table.horizontalHeader()
         all_cols_dl = self.download_queue.model.COLUMNS
         new_meta_dl = []
@@ -603,259 +829,435 @@ class MainWindow(QMainWindow):
             visible = not self.download_queue.table.isColumnHidden(l_idx)
             new_meta_dl.append({'name': name, 'visible': visible})
         self.settings.column_metadata_downloads = new_meta_dl
+        self.settings.header_state_downloads = header_dl.saveState()
 
+    @Slot()
     def _on_tag_to_filename(self):
-        indexes = self.file_list.selectionModel().selectedRows()
-        if not indexes:
+        rows = self._library_rows()
+        if not rows or self._saves_pending():
             return
             
-        from .dialogs import ConvertDialog
-        first_track = self.track_model.get_track(indexes[0].row())
-        dialog = ConvertDialog(mode="tag_to_filename", initial_track_info=first_track.metadata.copy(), parent=self)
-        dialog.track_info['filepath'] = first_track.file_path
-        
-        if dialog.exec():
-            fmt = dialog.get_format()
-            renamed_count = 0
-            total = len(indexes)
+        first_track = self.track_model.get_track(rows[0])
+        track_info = first_track.metadata.copy()
+        track_info['filepath'] = first_track.file_path
+        dialog = ConvertDialog(mode="tag_to_filename", initial_track_info=track_info, parent=self)
+        
+        # Opening the dialog ends editing in the tag editor, which can start a save
+        if dialog.exec() and not self._saves_pending():
+            plan = self.metadata_manager.compile_format(dialog.get_format())
+            total = len(rows)
+            renames = []  # (row, old_path, new_path)
+            tracks = self.track_model.tracks_view
+            # Existing names per directory, read once with scandir instead of an
+            # exists() stat per file. Case-insensitive filesystems compare folded names.
+            name_key = str.casefold if os.name == 'nt' or sys.platform == 'darwin' else str
+            existing_by_dir = {}
             
-            for idx in indexes:
-                track = self.track_model.get_track(idx.row())
-                new_basename = self.metadata_manager.resolve_format(fmt, track.metadata)
+            for row in rows:
+                track = tracks[row]
+                new_basename = plan.render(track.metadata)
                 new_basename = self.metadata_manager.sanitize_filename(new_basename)
                 
                 old_path = track.file_path
-                dir_name = os.path.dirname(old_path)
-                ext = os.path.splitext(old_path)[1]
-                new_path = os.path.join(dir_name, f"{new_basename}{ext}")
+                dir_name, old_name = os.path.split(old_path)
+                ext = os.path.splitext(old_name)[1]
+                new_name = f"{new_basename}{ext}"
+                
+                existing = existing_by_dir.get(dir_name)
+                if existing is None:
+                    try:
+                        with os.scandir(dir_name or '.') as it:
+                            existing = {name_key(e.name) for e in it}
+                    except OSError as e:
+                        print(f"Rename error: {e}")
+                        existing = None
+                    existing_by_dir[dir_name] = existing
+                if existing is None or name_key(new_name) in existing:
+                    continue
                 
-                if old_path != new_path and not os.path.exists(new_path):
+                # Reserve the target. The old name is not released: its rename
+                # runs concurrently, so another file must not be moved onto it.
+                existing.add(name_key(new_name))
+                renames.append((row, old_path, os.path.join(dir_name, new_name)))
+            
+            # Collision checks above stay serial; only the renames overlap
+            renamed_rows = []
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                futures = {ex.submit(os.replace, old, new): (row, new) for row, old, new in renames}
+                for fut in as_completed(futures):
+                    row, new_path = futures[fut]
                     try:
-                        os.rename(old_path, new_path)
-                        track.file_path = new_path
-                        self.track_model.update_track(idx.row())
-                        renamed_count += 1
-                    except Exception as e:
+                        fut.result()
+                    except OSError as e:
                         print(f"Rename error: {e}")
+                        continue
+                    tracks[row].file_path = new_path
+                    renamed_rows.append(row)
+            renamed_count = len(renamed_rows)
+            self.track_model.update_rows(renamed_rows)
             
             QMessageBox.information(self, "Conversion", f"{renamed_count} of {total} files renamed.")
 
+    @Slot()
     def _on_filename_to_tag(self):
-        indexes = self.file_list.selectionModel().selectedRows()
-        if not indexes:
+        rows = self._library_rows()
+        if not rows or self._saves_pending():
             return
             
-        from .dialogs import ConvertDialog
-        first_track = self.track_model.get_track(indexes[0].row())
+        first_track = self.track_model.get_track(rows[0])
         dialog = ConvertDialog(mode="filename_to_tag", initial_track_info={'filepath': first_track.file_path}, parent=self)
         
-        if dialog.exec():
-            fmt = dialog.get_format()
+        if dialog.exec() and not self._saves_pending():
+            plan = self.metadata_manager.compile_format(dialog.get_format())
             updated_count = 0
-            total = len(indexes)
+            total = len(rows)
+            updated_rows = []
+            tracks = self.track_model.tracks_view
             
-            for idx in indexes:
-                track = self.track_model.get_track(idx.row())
+            for row in rows:
+                track = tracks[row]
                 fname = os.path.basename(track.file_path)
-                extracted = self.metadata_manager.parse_filename(fmt, fname)
+                extracted = plan.parse(fname)
                 
                 if extracted:
                     # Update metadata
                     track.metadata.update(extracted)
                     if self.metadata_manager.save_tags(track.file_path, track.metadata):
-                        self.track_model.update_track(idx.row())
+                        updated_rows.append(row)
                         updated_count += 1
             
+            self.track_model.update_rows(updated_rows)
             QMessageBox.information(self, "Conversion", f"{updated_count} of {total} files updated.")
 
+    @Slot()
     def undo(self):
         if not self.undo_stack:
             return
             
+        # Undo writes synchronously; don't race the pool on the same files
+        if self._saves_pending():
+            return
+            
         last_action = self.undo_stack.pop()
         
         restored_count = 0
-        for path, old_tags in last_action:
+        restored_rows = []
+        tracks = self.track_model.tracks_view
+        for path, old_tags in zip(*last_action):
             if self.metadata_manager.save_tags(path, old_tags):
-                for r in range(self.track_model.rowCount()):
-                    t = self.track_model.get_track(r)
-                    if t.file_path == path:
-                        t.metadata = old_tags
-                        self.track_model.update_track(r)
-                        break
+                row = self.track_model.row_for_path(path)
+                if row is not None:
+                    tracks[row].metadata = dict(old_tags)
+                    restored_rows.append(row)
                 restored_count += 1
+        self.track_model.update_rows(restored_rows)
                 
         self.status_bar.showMessage(f"Undid changes for {restored_count} files.", 3000)
         self.action_undo.setEnabled(len(self.undo_stack) > 0)
+        self.action_clear_undo.setEnabled(len(self.undo_stack) > 0)
 
+    @Slot()
+    def _clear_undo_history(self):
+        self.undo_stack.clear()
+        self.action_undo.setEnabled(False)
+        self.action_clear_undo.setEnabled(False)
+
+    @Slot()
     def _open_directory_dialog(self):
         d = QFileDialog.getExistingDirectory(self, "Select Directory")
         if d:
             self.load_paths([d])
 
+    @Slot(list)
     def load_paths(self, paths):
+        # Loading replaces the library; earlier scans stop at their next batch
+        # and anything they already queued is ignored
+        for signals in self._active_scans:
+            signals.cancel()
+        self._active_scans.clear()
+        self._scanned_count = 0
+        self.track_model.set_tracks([])
         self.status_bar.showMessage("Scanning...")
-        all_tracks = []
+        
+        pool = QThreadPool.globalInstance()
+        exts = self.metadata_manager.SUPPORTED_EXT_SET
         for p in paths:
-            if os.path.isdir(p):
-                tracks = self.scanner.scan_directory(p)
-                all_tracks.extend(tracks)
-            elif os.path.isfile(p):
-                if p.lower().endswith(self.metadata_manager.SUPPORTED_EXTENSIONS):
-                    tags = self.metadata_manager.load_tags(p)
-                    track = Track(file_path=p, metadata=tags)
-                    all_tracks.append(track)
-        
-        print(f"Scanned {len(all_tracks)} tracks from dropped paths.")
-        self.track_model.set_tracks(all_tracks)
+            # Dropped files the scanner can't read don't need a worker
+            if not os.path.isdir(p) and os.path.splitext(p)[1].lower() not in exts:
+                continue
+            worker = ScanWorker(p)
+            worker.signals.batch_ready.connect(self._append_tracks, Qt.QueuedConnection)
+            worker.signals.finished.connect(self._on_scan_finished, Qt.QueuedConnection)
+            self._active_scans.add(worker.signals)
+            pool.start(worker)
+        
+        if not self._active_scans:
+            self._finish_scan()
+
+    @Slot(list)
+    def _append_tracks(self, tracks):
+        if self.sender() not in self._active_scans:
+            return
+        self._scanned_count += len(tracks)
+        self.track_model.append_tracks(tracks)
+        self.status_bar.showMessage(f"Scanning... {self._scanned_count} files")
+
+    @Slot()
+    def _on_scan_finished(self):
+        sender = self.sender()
+        if sender not in self._active_scans:
+            return
+        self._active_scans.discard(sender)
+        if not self._active_scans:
+            self._finish_scan()
+
+    def _finish_scan(self):
+        print(f"Scanned {self._scanned_count} tracks from dropped paths.")
         self._update_status_count()
-        self.status_bar.showMessage(f"Loaded {len(all_tracks)} files.", 3000)
+        self.status_bar.showMessage(f"Loaded {self._scanned_count} files.", 3000)
 
     def _update_status_count(self):
         count = self.track_model.rowCount()
         self.status_bar.showMessage(f"Total Files: {count}")
 
+    @Slot(int)
     def _on_tab_changed(self, index):
+        if index == 1:
+            self._ensure_download_queue()
         # Refresh editor State based on current selection in the new tab
-        if index == 0: # Library
-            indexes = self.file_list.selectionModel().selectedRows()
-            if not indexes:
-                 self.tag_editor.set_data({})
-            else:
-                 self._on_library_selection(None, None)
-        else: # Downloads
-            indexes = self.download_queue.table.selectionModel().selectedRows()
-            if not indexes:
-                 self.tag_editor.set_data({})
-            else:
-                 self._on_download_selection(None, None)
+        self._selection_timer.stop()
+        self._apply_current_selection()
 
     def _get_common_metadata(self, metadata_list):
         if not metadata_list:
             return {}, {}
         
-        # Collect all keys used across all items
-        all_keys = set()
+        # One pass. Most keys hold a single value across a bulk selection, so
+        # track the first value per key and only start a set on a second one.
+        first = {}  # key -> first non-empty value ('' while only empties seen)
+        extras = {}  # key -> distinct values, for keys with more than one
         for meta in metadata_list:
-            all_keys.update(meta.keys())
-            
-        common = {}
-        variants = {}
-        first = metadata_list[0]
-        
-        for key in all_keys:
-            vals = set()
-            for meta in metadata_list:
-                val = str(meta.get(key, ''))
-                if val: vals.add(val)
+            for key, val in meta.items():
+                val = str(val)
+                prev = first.get(key)
+                if not prev:
+                    first[key] = val
+                elif val and val != prev:
+                    more = extras.get(key)
+                    if more is None:
+                        extras[key] = {prev, val}
+                    else:
+                        more.add(val)
             
-            if len(vals) <= 1:
-                common[key] = list(vals)[0] if vals else ''
-                variants[key] = []
-            else:
-                common[key] = '<Multiple>'
-                variants[key] = sorted(list(vals))
-                
-        return common, variants
+        common = {key: '<Multiple>' if key in extras else val for key, val in first.items()}
+        # Variants stay unsorted; the tag editor sorts a field's list when it is opened
+        return common, extras
 
+    @Slot(QItemSelection, QItemSelection)
     def _on_library_selection(self, selected, deselected):
+        self._library_rows_cache = None
         if self.tabs.currentIndex() != 0: return
+        self._selection_timer.start()
+
+    @Slot(QItemSelection, QItemSelection)
+    def _on_download_selection(self, selected, deselected):
+        self._download_rows_cache = None
+        if self.tabs.currentIndex() != 1: return
+        self._selection_timer.start()
+
+    @Slot()
+    def _apply_current_selection(self):
+        if self.tabs.currentIndex() == 0:
+            self._show_library_selection()
+        else:
+            self._show_download_selection()
+
+    def _library_rows(self):
+        if self._library_rows_cache is None:
+            self._library_rows_cache = [i.row() for i in self.file_list.selectionModel().selectedRows()]
+        return self._library_rows_cache
+
+    def _download_rows(self):
+        if self._download_rows_cache is None:
+            self._download_rows_cache = [i.row() for i in self.download_queue.table.selectionModel().selectedRows()]
+        return self._download_rows_cache
 
-        indexes = self.file_list.selectionModel().selectedRows()
-        count = len(indexes)
+    def _invalidate_library_rows(self, *args):
+        self._library_rows_cache = None
+
+    def _invalidate_download_rows(self, *args):
+        self._download_rows_cache = None
+
+    def _show_library_selection(self):
+        rows = self._library_rows()
+        count = len(rows)
         
         if count == 0:
             self.tag_editor.set_data({})
         elif count == 1:
-            track = self.track_model.get_track(indexes[0].row())
+            track = self.track_model.get_track(rows[0])
             if track:
                 self.tag_editor.set_data(track.metadata, {})
         else:
-            tracks_meta = [self.track_model.get_track(idx.row()).metadata for idx in indexes]
+            tracks = self.track_model.tracks_view
+            tracks_meta = [tracks[row].metadata for row in rows]
             common, variants = self._get_common_metadata(tracks_meta)
             self.tag_editor.set_data(common, variants)
 
-    def _on_download_selection(self, selected, deselected):
-        if self.tabs.currentIndex() != 1: return
-
-        indexes = self.download_queue.table.selectionModel().selectedRows()
-        count = len(indexes)
+    def _show_download_selection(self):
+        rows = self._download_rows()
+        count = len(rows)
         
         if count == 0:
             self.tag_editor.set_data({})
         elif count == 1:
-            job = self.download_queue.model.get_job(indexes[0].row())
+            job = self.download_queue.model.get_job(rows[0])
             self.tag_editor.set_data(job, {})
         else:
-            jobs = [self.download_queue.model.get_job(idx.row()) for idx in indexes]
+            all_jobs = self.download_queue.model.jobs
+            jobs = [all_jobs[row] for row in rows]
             # Since jobs are dicts containing metadata keys
             common, variants = self._get_common_metadata(jobs)
             self.tag_editor.set_data(common, variants)
 
+    @Slot(dict)
     def _on_save_tags(self, data):
+        # '<Multiple>' marks fields the user left mixed across the selection
+        cover_path = data.pop('cover_path', None)
+        dirty_data = {k: v for k, v in data.items() if v != '<Multiple>'}
+        if not dirty_data and not cover_path:
+            self.status_bar.showMessage("No changes.", 2000)
+            return
+        
         # Context switching save
         if self.tabs.currentIndex() == 0:
-            self._save_library_tags(data)
+            self._save_library_tags(dirty_data, cover_path)
         else:
-            self._save_download_tags(data)
+            self._save_download_tags(dirty_data, cover_path)
 
-    def _save_library_tags(self, data):
-        indexes = self.file_list.selectionModel().selectedRows()
-        if not indexes: return
-        
-        count = 0
-        cover_path = data.pop('cover_path', None)
-        
-        dirty_data = {}
-        for k, v in data.items():
-            if v != '<Multiple>':
-                dirty_data[k] = v
+    def _save_library_tags(self, dirty_data, cover_path=None):
+        rows = self._library_rows()
+        if not rows: return
+        
+        # Undo entry as parallel tuples: (paths, old tag snapshots)
+        undo_paths = []
+        undo_tags = []
+        signals = SaveSignals()
+        signals.saved.connect(self._on_tag_saved, Qt.QueuedConnection)
+        jobs = []
+        saved_rows = []
+        tracks = self.track_model.tracks_view
+        
+        for row in rows:
+            track = tracks[row]
+            # The editor auto-saves on every focus-out; don't rewrite files whose
+            # tags already hold these values
+            if cover_path or any(str(track.metadata.get(k, '')) != v
+                                 for k, v in dirty_data.items()):
+                # Undo only reads the snapshot; the proxy keeps it that way
+                old_tags = dict(track.metadata)
+                undo_paths.append(track.file_path)
+                undo_tags.append(MappingProxyType(old_tags))
+                current_tags = {**old_tags, **dirty_data}
+                # Show the new values right away so the next auto-save builds on
+                # them; a failed write puts the old ones back
+                track.metadata = current_tags
+                saved_rows.append(row)
+                jobs.append(SaveJob(signals, track.file_path, current_tags, cover_path))
+        
+        if not jobs:
+            self.status_bar.showMessage("No changes.", 2000)
+            return
+        self._save_batches[signals] = {'pending': len(jobs), 'count': 0,
+                                       'undo': (tuple(undo_paths), tuple(undo_tags))}
+        self.track_model.update_rows(saved_rows)
+        self.status_bar.showMessage(f"Saving {len(jobs)} files...")
+        for job in jobs:
+            queued = self._writes.get(job.path)
+            if queued is None:
+                self._writes[job.path] = deque()
+                self._save_pool.start(job)
+            else:
+                # An earlier batch is still writing this file; run after it
+                queued.append(job)
+
+    def _saves_pending(self):
+        """
+        Renames, undo and Discogs matches write files directly; they wait until
+        the save pool is done with the library so a file has one writer at a time.
+        """
+        if self._writes:
+            self.status_bar.showMessage("Wait for pending saves to finish.", 3000)
+            return True
+        return False
+
+    @Slot(str, object, bool)
+    def _on_tag_saved(self, path, tags, success):
+        # Let the next write queued for this file go
+        queued = self._writes.get(path)
+        if queued:
+            self._save_pool.start(queued.popleft())
+        else:
+            self._writes.pop(path, None)
         
-        current_undo_batch = []
+        batch = self._save_batches.get(self.sender())
+        if batch is None:
+            return
         
-        for idx in indexes:
-            track = self.track_model.get_track(idx.row())
-            if track:
-                current_undo_batch.append((track.file_path, track.metadata.copy()))
-                
-                current_tags = track.metadata.copy()
-                current_tags.update(dirty_data)
-                
-                success = self.metadata_manager.save_tags(track.file_path, current_tags, cover_path)
-                if success:
-                    track.metadata = current_tags
-                    self.track_model.update_track(idx.row())
-                    count += 1
+        if success:
+            batch['count'] += 1
+        elif path not in self._writes:
+            # Nothing newer is pending for this file; show what is still on disk.
+            # Rows may have moved (sort/remove) while the write was running.
+            row = self.track_model.row_for_path(path)
+            if row is not None:
+                paths, snapshots = batch['undo']
+                self.track_model.get_track(row).metadata = dict(snapshots[paths.index(path)])
+                self._saved_paths.add(path)
+                if not self._saved_rows_timer.isActive():
+                    self._saved_rows_timer.start()
+        
+        batch['pending'] -= 1
+        if batch['pending']:
+            return
         
+        del self._save_batches[self.sender()]
+        count = batch['count']
         if count > 0:
-            self.undo_stack.append(current_undo_batch)
+            self.undo_stack.append(batch['undo'])
             self.action_undo.setEnabled(True)
+            self.action_clear_undo.setEnabled(True)
         
         self.status_bar.showMessage(f"Updated {count} files.", 3000)
 
-    def _save_download_tags(self, data):
+    @Slot()
+    def _refresh_saved_rows(self):
+        # Resolve rows now; they may have moved since the saves came in
+        rows = [self.track_model.row_for_path(p) for p in self._saved_paths]
+        self._saved_paths.clear()
+        self.track_model.update_rows([r for r in rows if r is not None])
+
+    def _save_download_tags(self, dirty_data, cover_path=None):
         # Update Pending jobs in download queue
-        indexes = self.download_queue.table.selectionModel().selectedRows()
-        if not indexes: return
+        rows = self._download_rows()
+        if not rows: return
         
         count = 0
-        # Ignore cover path for downloads (not supported in pre-download edit yet)
-        
-        dirty_data = {}
-        for k, v in data.items():
-            if v != '<Multiple>':
-                dirty_data[k] = v
+        # A dropped cover is stored on the job and embedded after download
+        if cover_path:
+            dirty_data = {**dirty_data, 'cover_path': cover_path}
         
         model = self.download_queue.model
-        for idx in indexes:
-            job = model.get_job(idx.row())
+        updated_rows = []
+        jobs = model.jobs
+        for row in rows:
+            job = jobs[row]
             if job['status'] == 'Pending':
                 # Update job dict
                 job.update(dirty_data)
-                # Signal model update for all columns (0 to 6)
-                start_idx = model.index(idx.row(), 0)
-                end_idx = model.index(idx.row(), 6)
-                model.dataChanged.emit(start_idx, end_idx)
+                updated_rows.append(row)
                 count += 1
+        # One view refresh per contiguous block instead of per row
+        model.update_rows(updated_rows)
         
         self.status_bar.showMessage(f"Updated {count} pending downloads.", 3000)
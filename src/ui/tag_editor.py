@@ -120,6 +120,40 @@ class DropZone(QLabel):
         
         self.setPixmap(result)
 
+class VariantComboBox(QComboBox):
+    """
+    Editable combo listing the distinct values of a multi-selection. The list
+    is only sorted and filled in when the combo is opened or focused.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setEditable(True)
+        self._pending_variants = None
+
+    def set_variants(self, values):
+        self.clear()
+        self._pending_variants = values or None
+
+    def _fill_variants(self):
+        if self._pending_variants is None:
+            return
+        values, self._pending_variants = self._pending_variants, None
+        # addItems would select the first entry; keep what is in the field
+        text = self.currentText()
+        blocked = self.blockSignals(True)
+        self.addItems(sorted(values))
+        self.setCurrentText(text)
+        self.blockSignals(blocked)
+
+    def showPopup(self):
+        self._fill_variants()
+        super().showPopup()
+
+    def focusInEvent(self, event):
+        self._fill_variants()
+        super().focusInEvent(event)
+
 class TagEditor(QWidget):
     save_clicked = Signal(dict)
 
@@ -143,57 +177,48 @@ class TagEditor(QWidget):
             return vbox
 
         # Title
-        self.title_edit = QComboBox()
-        self.title_edit.setEditable(True)
+        self.title_edit = VariantComboBox()
         add_v_field("Title:", self.title_edit)
 
         # Artist
-        self.artist_edit = QComboBox()
-        self.artist_edit.setEditable(True)
+        self.artist_edit = VariantComboBox()
         add_v_field("Artist:", self.artist_edit)
 
         # Album
-        self.album_edit = QComboBox()
-        self.album_edit.setEditable(True)
+        self.album_edit = VariantComboBox()
         add_v_field("Album:", self.album_edit)
 
         # Row: Year | Track
         row_yt = QHBoxLayout()
         row_yt.setSpacing(10)
         
-        self.year_edit = QComboBox()
-        self.year_edit.setEditable(True)
+        self.year_edit = VariantComboBox()
         self.year_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         add_v_field("Year:", self.year_edit, row_yt)
         
-        self.track_edit = QComboBox()
-        self.track_edit.setEditable(True)
+        self.track_edit = VariantComboBox()
         self.track_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         add_v_field("Track:", self.track_edit, row_yt)
         
         layout.addLayout(row_yt)
 
         # Comment
-        self.comment_edit = QComboBox()
-        self.comment_edit.setEditable(True)
+        self.comment_edit = VariantComboBox()
         add_v_field("Comment:", self.comment_edit)
 
         # Album Artist
-        self.album_artist_edit = QComboBox()
-        self.album_artist_edit.setEditable(True)
+        self.album_artist_edit = VariantComboBox()
         add_v_field("Album Artist:", self.album_artist_edit)
 
         # Composer
-        self.composer_edit = QComboBox()
-        self.composer_edit.setEditable(True)
+        self.composer_edit = VariantComboBox()
         add_v_field("Composer:", self.composer_edit)
 
         # Row: Disc | Genre
         row_dg = QHBoxLayout()
         row_dg.setSpacing(10)
 
-        self.disc_edit = QComboBox()
-        self.disc_edit.setEditable(True)
+        self.disc_edit = VariantComboBox()
         self.disc_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         add_v_field("Disc:", self.disc_edit, row_dg)
         
@@ -209,13 +234,11 @@ class TagEditor(QWidget):
         row_lc = QHBoxLayout()
         row_lc.setSpacing(10)
         
-        self.label_edit = QComboBox()
-        self.label_edit.setEditable(True)
+        self.label_edit = VariantComboBox()
         self.label_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         add_v_field("Label:", self.label_edit, row_lc)
         
-        self.catalog_edit = QComboBox()
-        self.catalog_edit.setEditable(True)
+        self.catalog_edit = VariantComboBox()
         self.catalog_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         add_v_field("Catalog #:", self.catalog_edit, row_lc)
         
@@ -277,13 +300,11 @@ class TagEditor(QWidget):
 
         for key, combo in mapping.items():
             # 1. Update items based on variants
-            v_list = variants.get(key, [])
-            combo.clear()
             if combo == self.genre_edit:
+                combo.clear()
                 combo.addItems(["Techno", "Melodic Techno", "Dark Techno"])
             else:
-                if v_list:
-                    combo.addItems(v_list)
+                combo.set_variants(variants.get(key))
             
             # 2. Set current text
             val = str(data.get(key, ''))
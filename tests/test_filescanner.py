@@ -6,7 +6,7 @@ import subprocess
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-from core.file_scanner import FileScanner
+from core.file_scanner import FileScanner, ScanWorker
 
 class TestFileScanner(unittest.TestCase):
     TEST_DIR = 'test_assets_scanner'
@@ -57,5 +57,24 @@ class TestFileScanner(unittest.TestCase):
         self.assertIn(self.files[1], found_paths)
         self.assertNotIn(self.files[2], found_paths)
 
+    def test_scan_worker_cancel(self):
+        worker = ScanWorker(self.TEST_DIR)
+        batches = []
+        finished = []
+        worker.signals.batch_ready.connect(batches.append)
+        worker.signals.finished.connect(lambda: finished.append(True))
+        worker.run()
+        self.assertEqual(sum(len(b) for b in batches), 2)
+        
+        # A canceled (superseded) scan emits no batches but still finishes
+        stale = ScanWorker(self.TEST_DIR)
+        stale_batches = []
+        stale.signals.batch_ready.connect(stale_batches.append)
+        stale.signals.finished.connect(lambda: finished.append(True))
+        stale.signals.cancel()
+        stale.run()
+        self.assertEqual(stale_batches, [])
+        self.assertEqual(finished, [True, True])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+import sys
+import os
+import re
+from unittest import mock
+
+from PySide6.QtWidgets import QApplication
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from src.core.metadata_manager import MetadataManager
+from src.ui.main_window import _best_track, _most_common
+from src.ui import discogs_dialog
+from src.ui.discogs_dialog import similarity_matrix
+
+# Initialize App once
+app = QApplication.instance()
+if not app:
+    app = QApplication(sys.argv)
+
+PLACEHOLDERS = {
+    '%artist%': 'artist', '%title%': 'title', '%album%': 'album', '%year%': 'year',
+    '%track%': 'track', '%genre%': 'genre', '%comment%': 'comment',
+}
+
+def legacy_resolve_format(format_str, tags):
+    """resolve_format as it was before FormatPlan."""
+    result = format_str
+    for placeholder, key in PLACEHOLDERS.items():
+        result = result.replace(placeholder, str(tags.get(key, '')))
+    return result
+
+def legacy_parse_filename(format_str, filename):
+    """parse_filename as it was before FormatPlan."""
+    name_only = os.path.splitext(filename)[0]
+    parts = re.split(r'(%[a-z]+%)', format_str)
+    pattern = ""
+    found_any = False
+    for i, part in enumerate(parts):
+        if part in PLACEHOLDERS:
+            is_last = (i == len(parts) - 1) or (i == len(parts) - 2 and not parts[-1])
+            pattern += f"(?P<{PLACEHOLDERS[part]}>.+)" if is_last else f"(?P<{PLACEHOLDERS[part]}>.+?)"
+            found_any = True
+        else:
+            pattern += re.escape(part)
+    if not found_any:
+        return {}
+    try:
+        match = re.match(f"^{pattern}$", name_only)
+        if match:
+            return {k: v for k, v in match.groupdict().items() if v is not None}
+    except re.error:
+        pass
+    return {}
+
+class TestFormatPlan(unittest.TestCase):
+    FORMATS = [
+        "%artist% - %title%",
+        "%track% - %title%",
+        "%artist% - %album% - %track% - %title%",
+        "[%year%] %album% (%genre%)",
+        "%title%",
+        "no placeholders",
+        "%artist% - %unknown% - %title%",
+        "%artist% - %artist%",
+        "",
+    ]
+    TAGS = [
+        {'artist': 'Daft Punk', 'title': 'Aerodynamic', 'album': 'Discovery', 'track': 3,
+         'year': '2001', 'genre': 'House'},
+        {'title': 'Only Title'},
+        {},
+    ]
+    FILENAMES = [
+        "Daft Punk - Aerodynamic.mp3",
+        "03 - Aerodynamic.flac",
+        "Daft Punk - Discovery - 03 - Aerodynamic.m4a",
+        "[2001] Discovery (House).mp3",
+        "a - b - c - d - e.mp3",
+        "no placeholders.mp3",
+        "nothing matches here",
+    ]
+
+    def test_render_matches_legacy(self):
+        for fmt in self.FORMATS:
+            plan = MetadataManager.compile_format(fmt)
+            for tags in self.TAGS:
+                with self.subTest(fmt=fmt, tags=tags):
+                    self.assertEqual(plan.render(tags), legacy_resolve_format(fmt, tags))
+                    self.assertEqual(MetadataManager.resolve_format(fmt, tags), legacy_resolve_format(fmt, tags))
+
+    def test_parse_matches_legacy(self):
+        for fmt in self.FORMATS:
+            plan = MetadataManager.compile_format(fmt)
+            for filename in self.FILENAMES:
+                with self.subTest(fmt=fmt, filename=filename):
+                    self.assertEqual(plan.parse(filename), legacy_parse_filename(fmt, filename))
+                    self.assertEqual(MetadataManager.parse_filename(fmt, filename),
+                                     legacy_parse_filename(fmt, filename))
+
+class TestTrackMatching(unittest.TestCase):
+    def test_best_track_no_duration(self):
+        # Ties go to the first entry; all-zero scores match nothing
+        self.assertEqual(_best_track([0.2, 0.9, 0.9], 0, [100, 200, 300]), (1, 0.9))
+        self.assertEqual(_best_track([0.0, 0.0], 0, [100, 200]), (None, 0.0))
+        self.assertEqual(_best_track([], 0, []), (None, 0.0))
+
+    def test_best_track_duration_boost(self):
+        # Within 4s gets +0.4 (capped at 1.0); over 15s off gets -0.2
+        self.assertEqual(_best_track([0.5, 0.3], 100, [300, 102]), (1, 0.7))
+        self.assertEqual(_best_track([0.9, 0.8], 100, [101, 500]), (0, 1.0))
+        idx, score = _best_track([0.5], 100, [200])
+        self.assertEqual(idx, 0)
+        self.assertAlmostEqual(score, 0.3)
+
+    def test_best_track_unknown_remote_duration(self):
+        # Tracks without a duration are scored on title alone
+        self.assertEqual(_best_track([0.7, 0.1], 100, [0, 0]), (0, 0.7))
+
+    def test_best_track_near_duration_neighbours(self):
+        # Another entry inside the 4s window (or without a duration) can win
+        # or tie, so the nearest-duration entry alone doesn't settle the match
+        self.assertEqual(_best_track([0.9, 0.7], 200, [203, 200]), (0, 1.0))
+        self.assertEqual(_best_track([0.2, 0.7], 200, [201, 200]), (1, 1.0))
+        self.assertEqual(_best_track([1.0, 0.7], 200, [0, 200]), (0, 1.0))
+
+    def test_most_common(self):
+        self.assertEqual(_most_common(['a', 'b', 'b', 'a']), 'a')
+        self.assertEqual(_most_common(['a', 'b', 'b']), 'b')
+        self.assertEqual(_most_common([]), '')
+
+    def test_similarity_matrix(self):
+        rows = similarity_matrix(['Aerodynamic', 'One More Time'],
+                                 ['One More Time', 'Aerodynamic', 'Digital Love'])
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(all(len(row) == 3 for row in rows))
+        self.assertAlmostEqual(rows[0][1], 1.0)
+        self.assertAlmostEqual(rows[1][0], 1.0)
+        for row in rows:
+            self.assertTrue(all(0.0 <= score <= 1.0 for score in row))
+        self.assertLess(rows[0][2], rows[0][1])
+        self.assertEqual(similarity_matrix([], ['x']), [])
+
+    def test_similarity_matrix_difflib_fallback(self):
+        # Same layout when rapidfuzz isn't installed
+        with mock.patch.object(discogs_dialog, 'process', None):
+            rows = similarity_matrix(['Aerodynamic', 'One More Time'],
+                                     ['One More Time', 'Aerodynamic', 'Digital Love'])
+        self.assertEqual(len(rows), 2)
+        self.assertAlmostEqual(rows[0][1], 1.0)
+        self.assertAlmostEqual(rows[1][0], 1.0)
+        self.assertLess(rows[0][2], rows[0][1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+import unittest
+import sys
+import os
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from src.ui.download_queue import DownloadJobModel
+from src.ui.file_list import TrackModel
+from src.core.track import Track
+
+# Initialize App once
+app = QApplication.instance()
+if not app:
+    app = QApplication(sys.argv)
+
+def make_jobs(count, start=0, status='Pending'):
+    return [{'status': status, 'title': f"Song {i:04d}", 'artist': 'Artist', 'track': str(i)}
+            for i in range(start, start + count)]
+
+class TestDownloadJobModel(unittest.TestCase):
+    def assertConsistent(self, model):
+        """Every lookup structure must agree with model.jobs."""
+        self.assertEqual(model.rowCount(), len(model.jobs))
+        self.assertEqual(len(model._row_cache), len(model.jobs))
+        self.assertEqual(len(model._job_row), len(model.jobs))
+        for row, job in enumerate(model.jobs):
+            self.assertEqual(model.row_for_job(job), row)
+        statuses = {job['status'] for job in model.jobs}
+        for status in statuses:
+            expected = [row for row, job in enumerate(model.jobs) if job['status'] == status]
+            self.assertEqual(sorted(model._rows_by_status[status]), expected)
+
+    def test_add_and_stage(self):
+        model = DownloadJobModel()
+        batch = DownloadJobModel.FETCH_BATCH
+        jobs = make_jobs(batch + 50)
+        model.add_jobs(jobs)
+        # Only the first batch is materialized; the rest waits for fetchMore
+        self.assertEqual(model.rowCount(), batch)
+        self.assertTrue(model.canFetchMore())
+        self.assertConsistent(model)
+
+        # Jobs added while others are staged queue up behind them
+        extra = make_jobs(3, start=1000)
+        model.add_jobs(extra)
+        self.assertEqual(model.rowCount(), batch)
+
+        model.fetchMore()
+        self.assertFalse(model.canFetchMore())
+        self.assertEqual(model.jobs, jobs + extra)
+        self.assertConsistent(model)
+
+    def test_rows_with_status_drains_staged(self):
+        model = DownloadJobModel()
+        model.add_jobs(make_jobs(DownloadJobModel.FETCH_BATCH + 10))
+        rows = model.rows_with_status('Pending')
+        self.assertEqual(rows, list(range(DownloadJobModel.FETCH_BATCH + 10)))
+        self.assertConsistent(model)
+
+    def test_status_index(self):
+        model = DownloadJobModel(make_jobs(5))
+        model.update_job_status(1, 'Done')
+        model.update_job_progress(3, 100)
+        model.update_job_progress(4, 50)
+        self.assertEqual(model.rows_with_status('Done'), [1, 3])
+        self.assertEqual(model.rows_with_status('Downloading'), [4])
+        self.assertEqual(model.rows_with_status('Pending'), [0, 2])
+        self.assertConsistent(model)
+
+    def test_row_for_job(self):
+        jobs = make_jobs(3)
+        model = DownloadJobModel(list(jobs))
+        model.add_jobs(make_jobs(2, start=3))
+        self.assertEqual([model.row_for_job(job) for job in jobs], [0, 1, 2])
+        # Lookup is by identity: an equal dict that isn't queued has no row
+        self.assertIsNone(model.row_for_job(dict(jobs[0])))
+        self.assertConsistent(model)
+
+    def test_progress_flush_keeps_other_rows_cached(self):
+        model = DownloadJobModel(make_jobs(10))
+        for row in range(10):
+            model.data(model.index(row, 0))
+        spans = []
+        model.dataChanged.connect(lambda tl, br, roles=(): spans.append((tl.row(), br.row())))
+        model.update_job_progress(1, 10)
+        model.update_job_progress(2, 20)
+        model.update_job_progress(8, 30)
+        model._flush_progress()
+        self.assertEqual(spans, [(1, 2), (8, 8)])
+        # Rows between the dirty runs keep their rendered text
+        for row in (0, 3, 4, 5, 6, 7, 9):
+            self.assertTrue(model._row_cache[row])
+        self.assertEqual(model.data(model.index(8, 0)), "30.0%")
+
+    def test_remove_runs(self):
+        model = DownloadJobModel(make_jobs(10))
+        removed = [model.jobs[r] for r in (2, 3, 7)]
+        model.remove_jobs([7, 2, 3])
+        self.assertEqual(model.rowCount(), 7)
+        for job in removed:
+            self.assertIsNone(model.row_for_job(job))
+            self.assertNotIn(job, model.jobs)
+        self.assertConsistent(model)
+
+    def test_remove_most_resets(self):
+        model = DownloadJobModel(make_jobs(10))
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+        keep = [model.jobs[0], model.jobs[9]]
+        model.remove_jobs(range(1, 9))
+        self.assertEqual(resets, [True])
+        self.assertEqual(model.jobs, keep)
+        self.assertConsistent(model)
+
+    def test_sort(self):
+        jobs = make_jobs(6)
+        jobs[2]['status'] = 'Done'
+        model = DownloadJobModel(list(jobs))
+        model.sort(1, Qt.DescendingOrder)
+        self.assertEqual(model.jobs, list(reversed(jobs)))
+        self.assertEqual(model.data(model.index(0, 1)), "Song 0005")
+        self.assertEqual(model.rows_with_status('Done'), [3])
+        model.sort(5, Qt.AscendingOrder)  # Track, numeric
+        self.assertEqual(model.jobs, jobs)
+        self.assertConsistent(model)
+
+    def test_invalid_index_flags(self):
+        model = DownloadJobModel(make_jobs(1))
+        self.assertEqual(model.flags(model.index(5, 0)), Qt.NoItemFlags)
+        self.assertTrue(model.flags(model.index(0, 1)) & Qt.ItemIsEditable)
+        self.assertFalse(model.flags(model.index(0, 0)) & Qt.ItemIsEditable)
+
+class TestTrackModel(unittest.TestCase):
+    def make_tracks(self, names):
+        return [Track(file_path=os.path.join('music', name), metadata={'title': name})
+                for name in names]
+
+    def test_remove_ranges(self):
+        model = TrackModel(self.make_tracks(['a.mp3', 'b.mp3', 'c.mp3', 'd.mp3', 'e.mp3']))
+        model.remove_tracks([3, 1, 1])
+        self.assertEqual([t.filename for t in model.tracks_view], ['a.mp3', 'c.mp3', 'e.mp3'])
+        # Removing most rows takes the reset path
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+        model.remove_tracks([0, 2])
+        self.assertEqual(resets, [True])
+        self.assertEqual([t.filename for t in model.tracks_view], ['c.mp3'])
+
+    def assertPathIndex(self, model):
+        for row, track in enumerate(model.tracks_view):
+            self.assertEqual(model.row_for_path(track.file_path), row)
+
+    def test_append_and_remove(self):
+        model = TrackModel()
+        model.set_tracks(self.make_tracks(['a.mp3', 'b.mp3']))
+        model.append_tracks(self.make_tracks(['c.mp3', 'd.mp3', 'e.mp3']))
+        self.assertPathIndex(model)
+
+        gone = model.get_track(1).file_path
+        model.remove_tracks([1])
+        self.assertIsNone(model.row_for_path(gone))
+        self.assertPathIndex(model)
+
+        # Removing most rows takes the reset path
+        model.remove_tracks([0, 1, 2])
+        self.assertEqual(model.rowCount(), 1)
+        self.assertPathIndex(model)
+
+    def test_sort(self):
+        model = TrackModel(self.make_tracks(['b.mp3', 'c.mp3', 'a.mp3']))
+        model.sort(0, Qt.AscendingOrder)
+        self.assertEqual([t.filename for t in model.tracks_view], ['a.mp3', 'b.mp3', 'c.mp3'])
+        self.assertPathIndex(model)
+
+    def test_path_change(self):
+        model = TrackModel(self.make_tracks(['a.mp3', 'b.mp3']))
+        old_path = model.get_track(1).file_path
+        model.get_track(1).file_path = os.path.join('music', 'renamed.mp3')
+        model.update_rows([1])
+        self.assertIsNone(model.row_for_path(old_path))
+        self.assertEqual(model.row_for_path(os.path.join('music', 'renamed.mp3')), 1)
+        self.assertIsNone(model.row_for_path('missing.mp3'))
+
+if __name__ == '__main__':
+    unittest.main()
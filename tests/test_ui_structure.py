@@ -1,14 +1,19 @@
 import unittest
 import sys
 import os
+import shutil
+import tempfile
+import threading
+from unittest import mock
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QRunnable
 
 # Add src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
 from src.ui.main_window import MainWindow
+from src.core.track import Track
 
 # Initialize App once
 app = QApplication.instance()
@@ -37,5 +42,58 @@ class TestUIStructure(unittest.TestCase):
         self.assertTrue(window.tag_editor)
         self.assertTrue(window.tag_editor.title_edit)
 
+class _Blocker(QRunnable):
+    """Holds a pool thread until released, so later jobs stay queued."""
+    def __init__(self, event):
+        super().__init__()
+        self.event = event
+
+    def run(self):
+        self.event.wait(5)
+
+class TestPendingSaves(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'old name.mp3')
+        with open(self.path, 'w') as f:
+            f.write('dummy')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_rename_waits_for_queued_save(self):
+        window = MainWindow()
+        track = Track(file_path=self.path, metadata={'title': 'New Name'})
+        window.track_model.set_tracks([track])
+        window.file_list.selectRow(0)
+        
+        release = threading.Event()
+        window._save_pool.setMaxThreadCount(1)
+        window._save_pool.start(_Blocker(release))
+        window._save_library_tags({'artist': 'Someone'})
+        self.assertIn(self.path, window._writes)
+        
+        dialog = mock.MagicMock()
+        dialog.exec.return_value = True
+        dialog.get_format.return_value = "%title%"
+        with mock.patch('src.ui.main_window.ConvertDialog', return_value=dialog), \
+             mock.patch('src.ui.main_window.QMessageBox'):
+            # The save is still queued: the file must keep its name
+            window._on_tag_to_filename()
+            self.assertTrue(os.path.exists(self.path))
+            self.assertEqual(track.file_path, self.path)
+            self.assertEqual(window.status_bar.currentMessage(), "Wait for pending saves to finish.")
+            
+            release.set()
+            window._save_pool.waitForDone()
+            app.processEvents()
+            self.assertEqual(window._writes, {})
+            
+            # Once the save has reported back the rename goes ahead
+            window._on_tag_to_filename()
+            new_path = os.path.join(self.tmp, 'New Name.mp3')
+            self.assertTrue(os.path.exists(new_path))
+            self.assertEqual(track.file_path, new_path)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file